@@ -0,0 +1,137 @@
+import argparse
+import json
+import platform
+import subprocess
+import time
+from importlib import metadata
+from pathlib import Path
+
+import polars
+
+from benchmarks import (
+    bench_datatable,
+    bench_import,
+    bench_memory,
+    bench_mvp,
+    bench_routing,
+)
+from benchmarks.timer import Benchmark, measure
+
+RESULTS_DIRECTORY = Path(__file__).parent / "results"
+BENCHMARKS: list[Benchmark] = [
+    *bench_import.BENCHMARKS,
+    *bench_routing.BENCHMARKS,
+    *bench_mvp.BENCHMARKS,
+    *bench_datatable.BENCHMARKS,
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run the fletched benchmarks."
+    )
+    parser.add_argument(
+        "-k", "--filter", default="", help="only run benchmarks containing this"
+    )
+    parser.add_argument(
+        "--max-size", type=int, help="skip sizes above this, e.g. 100000"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--output", type=Path, help="defaults to results/<version>.json"
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="results file of an earlier run to compare to"
+    )
+    arguments = parser.parse_args()
+
+    previous = {}
+    if arguments.compare:
+        previous = json.loads(arguments.compare.read_text())["results"]
+
+    results = {}
+    for benchmark in BENCHMARKS:
+        if arguments.filter not in benchmark.name:
+            continue
+        for size in benchmark.sizes:
+            if arguments.max_size is not None and size > arguments.max_size:
+                continue
+            name = f"{benchmark.name}[{size}]" if size else benchmark.name
+            result = measure(benchmark.setup(size), repeat=arguments.repeat)
+            results[name] = result
+            print(_format(name, result, previous.get(name)), flush=True)
+    for name, measurement in bench_memory.MEASUREMENTS.items():
+        if arguments.filter not in name:
+            continue
+        result = {"bytes": measurement()}
+        results[name] = result
+        print(_format(name, result, previous.get(name)), flush=True)
+
+    version = _get_version()
+    output = arguments.output or RESULTS_DIRECTORY / f"{version}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "version": version,
+                "commit": _get_commit(),
+                "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": platform.python_version(),
+                "flet": metadata.version("flet"),
+                "polars": polars.__version__,
+                "machine": platform.machine(),
+                "results": results,
+            },
+            indent=2,
+        )
+        + "\n"
+    )
+    print(f"results written to {output}")
+
+
+def _format(name: str, result: dict, previous_result: dict | None) -> str:
+    if "bytes" in result:
+        return _format_size(name, result, previous_result)
+    line = f"{name:<45} {_format_duration(result['median']):>10}"
+    if previous_result:
+        ratio = result["median"] / previous_result["median"]
+        line += f"  {_format_duration(previous_result['median']):>10}  {ratio:6.2f}x"
+    return line
+
+
+def _format_duration(seconds: float) -> str:
+    for unit, factor in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return f"{seconds / factor:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def _format_size(name: str, result: dict, previous_result: dict | None) -> str:
+    line = f"{name:<45} {result['bytes'] / 1024:>7.1f} KiB"
+    if previous_result:
+        ratio = result["bytes"] / previous_result["bytes"]
+        line += f"  {previous_result['bytes'] / 1024:>6.1f} KiB  {ratio:6.2f}x"
+    return line
+
+
+def _get_version() -> str:
+    try:
+        return metadata.version("fletched")
+    except metadata.PackageNotFoundError:
+        return "dev"
+
+
+def _get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    main()
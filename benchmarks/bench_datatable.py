@@ -0,0 +1,180 @@
+import tempfile
+from itertools import cycle
+from pathlib import Path
+from typing import Callable
+
+import polars as pl
+
+from benchmarks.timer import Benchmark
+from fletched.controls import ColumnFormat, ModelDataTable, ModelDataTableConfig
+
+ROW_COUNTS = (1_000, 100_000, 1_000_000)
+PAGE_SIZE = 100
+QUERIES = ("a", "al", "alp", "alph", "alpha", "ta 1", "bet", "gamma 9")
+CATEGORIES = ("alpha", "beta", "gamma", "delta", "epsilon")
+
+
+def get_model(row_count: int) -> pl.DataFrame:
+    ids = pl.arange(0, row_count, eager=True)
+    return pl.DataFrame(
+        {
+            "id": ids,
+            "name": pl.Series([CATEGORIES[i % 5] for i in range(row_count)])
+            + " "
+            + ids.cast(pl.Utf8),
+            "value": (ids * 7 % 1000) / 10,
+        }
+    )
+
+
+def get_table(row_count: int, **config: object) -> ModelDataTable:
+    return ModelDataTable(
+        model=get_model(row_count),
+        config=ModelDataTableConfig(page_size=PAGE_SIZE, **config),  # type: ignore
+    )
+
+
+def setup_assign(row_count: int) -> Callable[[], object]:
+    table = get_table(row_count)
+    models = cycle([get_model(row_count), get_model(row_count)])
+
+    def assign() -> None:
+        table.model = next(models)
+
+    return assign
+
+
+def setup_search(row_count: int) -> Callable[[], object]:
+    table = get_table(row_count, search=True, search_column_default_index=1)
+    queries = cycle(QUERIES)
+    return lambda: table._start_search(next(queries), debounce=None)
+
+
+def setup_search_index(row_count: int) -> Callable[[], object]:
+    table = get_table(
+        row_count, search=True, search_column_default_index=1, search_index=True
+    )
+    queries = cycle(QUERIES)
+    return lambda: table._start_search(next(queries), debounce=None)
+
+
+def setup_filter(row_count: int) -> Callable[[], object]:
+    table = get_table(
+        row_count, search=True, search_column_default_index=1, search_query_syntax=True
+    )
+    queries = cycle(["value>50", "value>50 alpha", "id:100..5000 value<10", "bet"])
+    return lambda: table._start_search(next(queries), debounce=None)
+
+
+def setup_search_summary(row_count: int) -> Callable[[], object]:
+    model = get_model(row_count).with_columns((pl.col("id") % 5).alias("group"))
+    config = ModelDataTableConfig(
+        page_size=PAGE_SIZE,
+        search=True,
+        search_column_default_index=1,
+        summary={"id": "count", "value": "sum"},
+        summary_group_by="group",
+    )
+    table = ModelDataTable(model=model, config=config)
+    queries = cycle(QUERIES)
+
+    def search() -> None:
+        # summaries are cached by search, which would only measure the cache
+        table._summaries.clear()
+        table._start_search(next(queries), debounce=None)
+
+    return search
+
+
+def setup_sort(row_count: int) -> Callable[[], object]:
+    table = get_table(row_count, sort=True)
+    orders = cycle([("value", False), ("value", True), ("name", False)])
+
+    def sort() -> None:
+        # sort orders are cached, which would only measure the cache
+        table._sort_permutations.clear()
+        table.sort(*next(orders))
+
+    return sort
+
+
+def setup_render_page(row_count: int) -> Callable[[], object]:
+    table = get_table(row_count)
+    pages = cycle(range(min(table.page_count, 50)))
+    return lambda: table.go_to_page(next(pages))
+
+
+def setup_render_page_formatted(row_count: int) -> Callable[[], object]:
+    table = get_table(
+        row_count,
+        column_formats={
+            "id": ColumnFormat(thousands_separator=","),
+            "name": ColumnFormat(max_length=8),
+            "value": ColumnFormat(precision=2),
+        },
+    )
+    pages = cycle(range(min(table.page_count, 50)))
+
+    def render_page() -> None:
+        # formatted pages are cached, which would only measure the cache
+        table._formatted_windows.clear()
+        table.go_to_page(next(pages))
+
+    return render_page
+
+
+def get_append(row_count: int, **config: object) -> Callable[[], object]:
+    # a full ring buffer that is searched, every append drops as many rows
+    model = get_model(row_count)
+    table = ModelDataTable(
+        model=model,
+        config=ModelDataTableConfig(
+            search=True,
+            search_column_default_index=1,
+            max_rows=row_count,
+            **config,  # type: ignore
+        ),
+    )
+    table._start_search("alpha", debounce=None)
+    batches = cycle([model.slice(offset, 100) for offset in range(0, 1000, 100)])
+    return lambda: table.append(next(batches))
+
+
+def setup_append(row_count: int) -> Callable[[], object]:
+    return get_append(row_count, page_size=PAGE_SIZE)
+
+
+def setup_append_all_rows(row_count: int) -> Callable[[], object]:
+    # only the rows of new matches are created, the others are kept
+    return get_append(row_count)
+
+
+def setup_export(row_count: int) -> Callable[[], object]:
+    table = get_table(row_count, sort=True)
+    table.sort("value")
+    path = Path(tempfile.mkdtemp()) / "export.csv"
+    return lambda: table.export(path).result()
+
+
+def setup_render_all(row_count: int) -> Callable[[], object]:
+    model = get_model(row_count)
+    table = ModelDataTable(model=model, config=ModelDataTableConfig())
+    models = cycle([model.reverse(), model])
+    return lambda: table.render_model(next(models))
+
+
+BENCHMARKS = [
+    Benchmark("table.assign_model", setup_assign, ROW_COUNTS),
+    Benchmark("table.search", setup_search, ROW_COUNTS),
+    Benchmark("table.search_index", setup_search_index, ROW_COUNTS),
+    Benchmark("table.search_summary", setup_search_summary, ROW_COUNTS),
+    Benchmark("table.filter", setup_filter, ROW_COUNTS),
+    Benchmark("table.sort", setup_sort, ROW_COUNTS),
+    Benchmark("table.render_page", setup_render_page, ROW_COUNTS),
+    Benchmark("table.render_page_formatted", setup_render_page_formatted, ROW_COUNTS),
+    Benchmark("table.append", setup_append, ROW_COUNTS),
+    Benchmark("table.append_all_rows", setup_append_all_rows, (1_000,)),
+    Benchmark("table.export_csv", setup_export, ROW_COUNTS),
+    # every row becomes a control, so only small models make sense here
+    Benchmark("table.render_all_rows", setup_render_all, (1_000,)),
+]
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+from typing import Callable
+
+from benchmarks.timer import Benchmark
+
+IMPORTS = {
+    # the interpreter itself, to put the other numbers into perspective
+    "import.python": "pass",
+    "import.fletched": "import fletched",
+    "import.mvp_model": "from fletched.mvp import MvpDataSource, MvpModel",
+    "import.mvp_view": "from fletched.mvp import MvpView, MvpViewBuilder",
+    "import.routed_app": "from fletched.routed_app import RoutedApp, route",
+    "import.controls": "from fletched.controls import ModelDataTable",
+}
+
+
+def setup_import(statement: str) -> Callable[[int], Callable[[], object]]:
+    # every import runs in a fresh interpreter, so nothing is cached in sys.modules
+    def setup(size: int) -> Callable[[], object]:
+        return lambda: subprocess.run([sys.executable, "-c", statement], check=True)
+
+    return setup
+
+
+BENCHMARKS = [
+    Benchmark(name, setup_import(statement)) for name, statement in IMPORTS.items()
+]
@@ -0,0 +1,42 @@
+import gc
+import tracemalloc
+from typing import Callable
+
+from benchmarks.bench_routing import get_app, get_routes
+
+SESSIONS = 50
+
+
+def measure_session_memory(session: Callable[[], object]) -> int:
+    # average number of bytes a session keeps allocated, class level caches excluded
+    session()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        sessions = [session() for _ in range(SESSIONS)]
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del sessions
+    return (after - before) // SESSIONS
+
+
+def routing_session() -> object:
+    app, page = get_app()
+    page.go("/section1/1")
+    return app
+
+
+def view_cache_session() -> object:
+    app, page = get_app(view_cache_size=10)
+    for route in get_routes()[:10]:
+        page.go(route)
+    return app
+
+
+MEASUREMENTS: dict[str, Callable[[], int]] = {
+    "memory.session": lambda: measure_session_memory(routing_session),
+    "memory.session_view_cache": lambda: measure_session_memory(view_cache_session),
+}
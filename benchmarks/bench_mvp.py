@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from itertools import count
+from typing import Callable
+
+import flet as ft
+from pydantic import create_model
+
+from benchmarks.timer import Benchmark
+from fletched.mvp import MvpDataSource, MvpModel, MvpPresenter, MvpView, ViewConfig
+
+FIELD_COUNTS = (10, 100, 1000)
+
+
+@dataclass
+class BenchmarkPresenter(MvpPresenter):
+    pass
+
+
+def get_presenter(field_count: int) -> BenchmarkPresenter:
+    fields = [f"field_{index}" for index in range(field_count)]
+    model_class = create_model(
+        "BenchmarkModel", __base__=MvpModel, **{field: (str, "") for field in fields}
+    )
+    data_source_class = type(
+        "BenchmarkDataSource", (MvpDataSource,), {"current_model": model_class()}
+    )
+    ref_map = {field: ft.Ref[ft.TextField]() for field in fields}
+
+    def build(self: MvpView, presenter: MvpPresenter) -> None:
+        self.controls = [ft.TextField(ref=ref) for ref in ref_map.values()]
+
+    view_class = type(
+        "BenchmarkView",
+        (MvpView,),
+        {"ref_map": ref_map, "config": ViewConfig(), "build": build},
+    )
+    presenter = BenchmarkPresenter(
+        data_source=data_source_class(app=None, route_params={}),
+        view=view_class(),
+    )
+    presenter.build()
+    return presenter
+
+
+def setup_update_one_field(field_count: int) -> Callable[[], object]:
+    presenter = get_presenter(field_count)
+    values = count()
+    return lambda: presenter.data_source.update_model_partial(
+        {"field_0": str(next(values))}
+    )
+
+
+def setup_update_all_fields(field_count: int) -> Callable[[], object]:
+    presenter = get_presenter(field_count)
+    fields = list(presenter.data_source.current_model.__fields__)
+    values = count()
+
+    def update() -> None:
+        value = str(next(values))
+        presenter.data_source.update_model_complete({field: value for field in fields})
+
+    return update
+
+
+def setup_render_unchanged(field_count: int) -> Callable[[], object]:
+    presenter = get_presenter(field_count)
+    model = presenter.data_source.current_model
+    return lambda: presenter.view.render(model)
+
+
+BENCHMARKS = [
+    Benchmark("mvp.update_one_field", setup_update_one_field, FIELD_COUNTS),
+    Benchmark("mvp.update_all_fields", setup_update_all_fields, FIELD_COUNTS),
+    Benchmark("mvp.render_unchanged", setup_render_unchanged, FIELD_COUNTS),
+]
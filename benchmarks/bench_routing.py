@@ -0,0 +1,82 @@
+from itertools import cycle
+from typing import Callable
+
+import flet as ft
+
+from benchmarks.fake_page import FakePage
+from benchmarks.timer import Benchmark
+from fletched.routed_app import RoutedApp, ViewBuilder
+
+SECTIONS = 100
+VIEW_BUILDER_CLASSES: list[type[ViewBuilder]] = []
+
+
+class BenchmarkViewBuilder(ViewBuilder):
+    def build_view(self, route_params: dict[str, str]) -> ft.View:
+        return ft.View(route=self.route)
+
+
+def get_view_builder_classes() -> list[type[ViewBuilder]]:
+    # created once, like the ViewBuilder classes of a real app
+    if not VIEW_BUILDER_CLASSES:
+        for section in range(SECTIONS):
+            for route in (
+                f"/section{section}",
+                f"/section{section}/:id",
+                f"/section{section}/:id/edit",
+            ):
+                VIEW_BUILDER_CLASSES.append(
+                    type("ViewBuilder", (BenchmarkViewBuilder,), {"route": route})
+                )
+    return VIEW_BUILDER_CLASSES
+
+
+def get_app(view_cache_size: int = 0) -> tuple[RoutedApp, FakePage]:
+    page = FakePage()
+    app = RoutedApp(page, view_cache_size=view_cache_size)  # type: ignore
+    app.add_view_builders(get_view_builder_classes())
+    return app, page
+
+
+def get_routes() -> list[str]:
+    routes = []
+    for section in range(SECTIONS):
+        routes.append(f"/section{section}")
+        routes.append(f"/section{section}/{section}")
+        routes.append(f"/section{section}/{section}/edit")
+    routes.append("/does/not/exist")
+    return routes
+
+
+def setup_match(size: int) -> Callable[[], object]:
+    app, _ = get_app()
+    routes = cycle(get_routes())
+    # the LRU cache is bypassed to measure the match itself
+    return lambda: app.route_table._match(next(routes))
+
+
+def setup_match_cached(size: int) -> Callable[[], object]:
+    app, _ = get_app()
+    # fewer routes than the cache holds, so every match is a cache hit
+    routes = cycle(get_routes()[:100])
+    return lambda: app.route_table.match(next(routes))
+
+
+def setup_navigate(size: int) -> Callable[[], object]:
+    _, page = get_app()
+    routes = cycle(get_routes())
+    return lambda: page.go(next(routes))
+
+
+def setup_navigate_cached(size: int) -> Callable[[], object]:
+    _, page = get_app(view_cache_size=len(get_routes()))
+    routes = cycle(get_routes())
+    return lambda: page.go(next(routes))
+
+
+BENCHMARKS = [
+    Benchmark("routing.match", setup_match),
+    Benchmark("routing.match_cached", setup_match_cached),
+    Benchmark("routing.navigate", setup_navigate),
+    Benchmark("routing.navigate_view_cache", setup_navigate_cached),
+]
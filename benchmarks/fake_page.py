@@ -0,0 +1,26 @@
+from typing import Any, Callable
+
+import flet as ft
+
+
+class FakePage:
+    # stands in for ft.Page, so no flet client has to be running
+
+    def __init__(self) -> None:
+        self.route = "/"
+        self.views: list[ft.View] = []
+        self.controls: list[ft.Control] = []
+        self.on_route_change: Callable | None = None
+        self.on_view_pop: Callable | None = None
+        self.update_count = 0
+
+    def go(self, route: str) -> None:
+        self.route = route
+        if self.on_route_change:
+            self.on_route_change(ft.RouteChangeEvent(route=route))
+
+    def update(self, *controls: Any) -> None:
+        self.update_count += 1
+
+    def add(self, *controls: ft.Control) -> None:
+        self.controls.extend(controls)
@@ -0,0 +1,40 @@
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+MIN_DURATION = 0.2
+
+
+@dataclass
+class Benchmark:
+    name: str
+    # returns the function to time, everything it does itself is not measured
+    setup: Callable[[int], Callable[[], object]]
+    sizes: tuple[int, ...] = (0,)
+
+
+def measure(function: Callable[[], object], repeat: int = 5) -> dict[str, float]:
+    # calls per run are chosen so that a run takes at least MIN_DURATION
+    number = 1
+    while True:
+        duration = _run(function, number)
+        if duration >= MIN_DURATION or number >= 1_000_000:
+            break
+        number *= 10 if duration < MIN_DURATION / 10 else 2
+
+    timings = [duration / number]
+    timings.extend(_run(function, number) / number for _ in range(repeat - 1))
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def _run(function: Callable[[], object], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return time.perf_counter() - start
@@ -1 +1,11 @@
-from fletched import controls, mvp, routed_app
+from typing import TYPE_CHECKING
+
+from fletched.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from fletched import controls, instrumentation, mvp, routed_app
+
+__all__ = ["controls", "instrumentation", "mvp", "routed_app"]
+__getattr__, __dir__ = lazy_exports(
+    globals(), {name: f"{__name__}.{name}" for name in __all__}
+)
@@ -1,5 +1,38 @@
-from fletched.controls.datatable import (
-    DataTableConfig,
-    ModelDataTable,
-    ModelDataTableConfig,
+from typing import TYPE_CHECKING
+
+from fletched.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from fletched.controls.datatable import (
+        DataTableConfig,
+        ModelDataTable,
+        ModelDataTableConfig,
+    )
+    from fletched.controls.filters import IsNull, Matches, OneOf, Predicate, Range
+    from fletched.controls.formatting import ColumnFormat
+
+__all__ = [
+    "ColumnFormat",
+    "DataTableConfig",
+    "IsNull",
+    "Matches",
+    "ModelDataTable",
+    "ModelDataTableConfig",
+    "OneOf",
+    "Predicate",
+    "Range",
+]
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "ColumnFormat": "fletched.controls.formatting",
+        "DataTableConfig": "fletched.controls.datatable",
+        "IsNull": "fletched.controls.filters",
+        "Matches": "fletched.controls.filters",
+        "ModelDataTable": "fletched.controls.datatable",
+        "ModelDataTableConfig": "fletched.controls.datatable",
+        "OneOf": "fletched.controls.filters",
+        "Predicate": "fletched.controls.filters",
+        "Range": "fletched.controls.filters",
+    },
 )
@@ -1,5 +1,12 @@
-from dataclasses import asdict, dataclass
-from typing import Any, Callable, Optional, Union
+import threading
+import warnings
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, replace
+from functools import reduce
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
 
 import flet as ft
 import polars as pl
@@ -13,6 +20,22 @@ from flet_core.types import (
     ScaleValue,
 )
 
+from fletched import instrumentation
+from fletched.controls.export import export_view, get_export_executor, get_export_format
+from fletched.controls.filters import Predicate, get_filter_expression, parse_query
+from fletched.controls.formatting import ColumnFormat
+from fletched.controls.search_index import TrigramIndex
+
+ALL_COLUMNS = "__all_columns__"
+SORT_CACHE_SIZE = 8
+# lazy models are never collected as a whole, so they are always paginated
+LAZY_PAGE_SIZE = 100
+FORMAT_CACHE_SIZE = 8
+SUMMARY_CACHE_SIZE = 8
+# appended rows are only copied into one chunk once there are this many
+MAX_CHUNKS = 64
+ROW_NUMBER = "__row_number__"
+
 
 @dataclass
 class DataTableConfig:
@@ -68,7 +91,24 @@ class ModelDataTableConfig:
     ref: ft.Ref | None = None
     search: bool = False
     search_column_default_index: int = 0
+    search_debounce: float | None = None
+    search_case_sensitive: bool = True
+    search_all_columns: bool = False
+    search_index: bool = False
+    search_query_syntax: bool = False
     create_text_model: bool = False
+    sort: bool = False
+    # windowing
+    page_size: int | None = None
+    # appending
+    max_rows: int | None = None
+    append_interval: float | None = None
+    # rendering
+    row_key: str | None = None
+    column_formats: dict[str, ColumnFormat] | None = None
+    # summaries
+    summary: dict[str, str | pl.Expr] | None = None
+    summary_group_by: str | None = None
     # row callbacks
     on_select_changed_row: Callable | None = None
     on_long_press_row: Callable | None = None
@@ -81,32 +121,115 @@ class ModelDataTableConfig:
     # column callbacks
     on_sort_column: Callable | None = None
 
+    def __post_init__(self) -> None:
+        if self.create_text_model:
+            warnings.warn(
+                "create_text_model has no effect anymore, "
+                "text columns are created when they are first searched",
+                DeprecationWarning,
+                # the caller of the generated __init__
+                stacklevel=3,
+            )
+        if self.summary_group_by and not self.summary:
+            # the group table would have no columns, which flet can't show
+            raise ValueError("summary_group_by needs a summary to aggregate")
+
 
 class ModelDataTable(ft.UserControl):
     def __init__(
         self,
         *,
-        model: pl.DataFrame,
+        model: pl.DataFrame | pl.LazyFrame,
         config: ModelDataTableConfig = ModelDataTableConfig(),
         dt_config: DataTableConfig = DataTableConfig(),
     ) -> None:
         super().__init__(ref=config.ref)
         self.data_table = ft.DataTable(**asdict(dt_config))
+        if isinstance(model, pl.LazyFrame) and not config.page_size:
+            config = replace(config, page_size=LAZY_PAGE_SIZE)
         self.config = config
+        self.page_index = 0
+        self._column_names: list[str] = []
+        self._row_controls: dict[Any, ft.DataRow] = {}
+        self._search_lock = threading.Lock()
+        self._search_generation = 0
+        self._search_timer: threading.Timer | None = None
+        self._search_result: tuple[str, str, pl.Series | None] | None = None
+        self._filters: list[Predicate] = []
+        self._text_columns: dict[str, pl.Series] = {}
+        self._search_columns: dict[str, pl.Series] = {}
+        self._search_indexes: dict[str, TrigramIndex] = {}
+        self._sort_by: list[tuple[str, bool]] = []
+        self._sort_permutations: OrderedDict[
+            tuple[tuple[str, bool], ...], tuple[pl.Series, pl.Series]
+        ] = OrderedDict()
+        self._formatted_windows: OrderedDict[tuple, pl.DataFrame] = OrderedDict()
+        self._summaries: OrderedDict[
+            tuple, tuple[pl.DataFrame, pl.DataFrame | None]
+        ] = OrderedDict()
+        self._summary = pl.DataFrame()
+        self._summary_row: ft.DataRow | None = None
+        self._pending_rows: list[pl.DataFrame] = []
+        self._append_timer: threading.Timer | None = None
+        self._rows_built = 0
+        if config.sort and dt_config.sort_column_index is not None:
+            self._sort_by = [
+                (
+                    model.columns[dt_config.sort_column_index],
+                    dt_config.sort_ascending is False,
+                )
+            ]
+        if config.page_size:
+            self._setup_pagination_bar()
+        if config.summary_group_by:
+            self.group_table = ft.DataTable()
         self.model = model
         if config.search:
             self._setup_search_bar()
 
     @property
-    def model(self) -> pl.DataFrame:
+    def model(self) -> pl.DataFrame | pl.LazyFrame:
         return self._original_model
 
     @model.setter
-    def model(self, model: pl.DataFrame) -> None:
-        self._original_model = model
-        self.render_model(self._original_model)
-        if self.config.create_text_model or self.config.search:
-            self._text_model = model.with_columns(pl.col("*").cast(pl.Utf8))
+    def model(self, model: pl.DataFrame | pl.LazyFrame) -> None:
+        if isinstance(model, pl.LazyFrame) and not self.config.page_size:
+            raise ValueError("lazy models can only be shown with a page_size")
+        with self._search_lock:
+            # results of searches still running refer to the old model
+            self._search_generation += 1
+            search = self._search_result
+            self._search_result = None
+            self._original_model = model
+            # the caches are replaced only after the model,
+            # see _get_text_column
+            self._text_columns = {}
+            self._search_columns = {}
+            self._search_indexes = {}
+            # rows for the previous model are dropped
+            self._pending_rows = []
+            # the search that is applied (and still shown in the search field)
+            # is run again on the new rows
+            column, query = search[:2] if search else (ALL_COLUMNS, "")
+            if column != ALL_COLUMNS and column not in model.columns:
+                column, query = ALL_COLUMNS, ""
+            if query or self._filters:
+                self._search_result = (column, query, self._search(query, column))
+            self._sort_permutations = OrderedDict()
+            self._formatted_windows = OrderedDict()
+            self._summaries = OrderedDict()
+            self._sort_by = [key for key in self._sort_by if key[0] in model.columns]
+            # a debounced query still waiting is applied to the new model
+            self._restart_pending_search()
+            self._refresh()
+
+    @property
+    def _text_model(self) -> pl.DataFrame | pl.LazyFrame:
+        if isinstance(self._original_model, pl.LazyFrame):
+            return self._original_model.select(pl.all().cast(pl.Utf8))
+        return pl.DataFrame(
+            [self._get_text_column(column) for column in self._original_model.columns]
+        )
 
     def build(self) -> ft.Container:
         scroll = ft.ScrollMode.ADAPTIVE if not self.data_table.expand else None
@@ -118,23 +241,404 @@ class ModelDataTable(ft.UserControl):
         ]
         if self.config.search:
             controls.insert(0, self.search_bar)
+        if self.config.page_size:
+            controls.append(self.pagination_bar)
+        if self.config.summary_group_by:
+            controls.append(ft.Row([self.group_table], scroll=scroll))
         return ft.Container(ft.Column(controls), border=ft.border.all(2))
 
+    @property
+    def page_count(self) -> int:
+        if not self.config.page_size:
+            return 1
+        return max(1, -(-self._displayed_height // self.config.page_size))
+
+    @property
+    def _displayed_height(self) -> int:
+        if self._displayed_rows is not None:
+            return len(self._displayed_rows)
+        if isinstance(self._displayed_model, pl.LazyFrame):
+            if self._displayed_count is None:
+                count = self._displayed_model.select(pl.count()).collect()
+                self._displayed_count = int(count.item())
+            return self._displayed_count
+        return self._displayed_model.height
+
+    def append(self, rows: pl.DataFrame) -> None:
+        if isinstance(self._original_model, pl.LazyFrame):
+            raise TypeError("rows can only be appended to a DataFrame model")
+        with self._search_lock:
+            self._pending_rows.append(rows)
+            if self.config.append_interval is None:
+                self._append_pending_rows()
+            elif self._append_timer is None:
+                # rows arriving until then are appended and rendered together
+                self._append_timer = threading.Timer(
+                    self.config.append_interval, self._run_append
+                )
+                self._append_timer.daemon = True
+                self._append_timer.start()
+
+    def consume(self, source: Iterable[pl.DataFrame]) -> threading.Thread:
+        def run() -> None:
+            for rows in source:
+                self.append(rows)
+
+        thread = threading.Thread(target=run, name="fletched-consume", daemon=True)
+        thread.start()
+        return thread
+
     def render_model(self, model: pl.DataFrame) -> None:
-        self.data_table.columns = [
-            ft.DataColumn(ft.Text(column), on_sort=self.config.on_sort_column)
-            for column in model.columns
-        ]
-        self.data_table.rows = [
-            ft.DataRow(
-                [self._get_cell(cell) for cell in row],
-                on_select_changed=self.config.on_select_changed_row,
-                on_long_press=self.config.on_long_press_row,
+        self._update_summaries(model)
+        self._render(model)
+
+    def sort(
+        self, by: str | list[str] | None, descending: bool | list[bool] = False
+    ) -> None:
+        columns = [by] if isinstance(by, str) else by or []
+        if isinstance(descending, bool):
+            descending = [descending] * len(columns)
+        with self._search_lock:
+            self._sort_by = list(zip(columns, descending, strict=True))
+            if self._sort_by:
+                column, column_descending = self._sort_by[0]
+                self.data_table.sort_column_index = self._original_model.columns.index(
+                    column
+                )
+                self.data_table.sort_ascending = not column_descending
+            else:
+                self.data_table.sort_column_index = None
+            self._refresh()
+
+    def filter(self, predicates: list[Predicate] | None) -> None:
+        with self._search_lock:
+            self._filters = list(predicates or [])
+            # results and caches of the current search were found with other filters
+            search = self._search_result
+            self._search_result = None
+            self._formatted_windows = OrderedDict()
+            self._summaries = OrderedDict()
+            self._restart_pending_search()
+            if search:
+                self._apply_search(search[1], search[0])
+            else:
+                self._apply_search("", ALL_COLUMNS)
+
+    def export(
+        self,
+        path: str | Path,
+        file_format: str | None = None,
+        on_progress: Callable[[float], None] | None = None,
+    ) -> Future[Path]:
+        path = Path(path)
+        file_format = file_format or get_export_format(path)
+        with self._search_lock:
+            # the rows that are displayed right now, later changes don't matter
+            view, rows = self._displayed_model, self._displayed_rows
+            sink = isinstance(view, pl.LazyFrame) and not self._sort_by
+        return get_export_executor().submit(
+            export_view, view, rows, path, file_format, on_progress, sink
+        )
+
+    def _refresh(self, page_index: int = 0) -> None:
+        search = self._search_result[:2] if self._search_result else None
+        display_key = (tuple(self._sort_by), search)
+        if isinstance(self._original_model, pl.LazyFrame):
+            # summaries are cached by search, the sort order doesn't change them
+            self._update_summaries(self._get_lazy_view(sort=False), cache_key=(search,))
+            self._render(
+                self._get_lazy_view(), display_key=display_key, page_index=page_index
             )
-            for row in model.rows()
-        ]
+            return
+        # filtered and sorted rows are only gathered window by window
+        rows = self._search_result[2] if self._search_result else None
+        self._update_summaries(self._original_model, rows, cache_key=(search,))
+        if self._sort_by:
+            permutation, positions = self._get_sort_permutation()
+            if rows is None:
+                rows = permutation
+            else:
+                rows = rows.take(positions.take(rows).arg_sort())
+        self._render(self._original_model, rows, display_key, page_index)
+
+    def _get_lazy_view(self, sort: bool = True) -> pl.LazyFrame:
+        # filter, sort and slice are pushed down into the query,
+        # only the rows of the current window are ever collected
+        view: pl.LazyFrame = self._original_model  # type: ignore
+        if self._search_result:
+            column, query, _ = self._search_result
+            view = view.filter(self._get_search_expression(query, column))
+        if sort and self._sort_by:
+            columns = [column for column, _ in self._sort_by]
+            descending = [column_descending for _, column_descending in self._sort_by]
+            # without nulls_last, the top-k sort polars uses for a slice
+            # puts nulls first and pages would overlap
+            view = (
+                view.with_row_count(ROW_NUMBER)
+                .sort(
+                    [*columns, ROW_NUMBER],
+                    descending=[*descending, False],
+                    nulls_last=True,
+                )
+                .drop(ROW_NUMBER)
+            )
+        return view
+
+    def _get_sort_permutation(self) -> tuple[pl.Series, pl.Series]:
+        key = tuple(self._sort_by)
+        if key in self._sort_permutations:
+            self._sort_permutations.move_to_end(key)
+            return self._sort_permutations[key]
+        toggled = tuple((column, not descending) for column, descending in key)
+        if len(key) == 1 and toggled in self._sort_permutations:
+            # clicking a sorted column again only flips the direction
+            permutation = self._get_reversed_permutation(
+                key[0][0], self._sort_permutations[toggled][0]
+            )
+        else:
+            columns, descending = self._get_sort_keys(key)
+            # the row number as last sort key makes the sort stable
+            permutation = self._original_model.select(
+                pl.arg_sort_by(
+                    [*columns, pl.arange(0, pl.count(), dtype=pl.UInt32)],
+                    descending=[*descending, False],
+                )
+            ).to_series()
+        # position of every row in the sorted model, used to sort search results
+        positions = permutation.arg_sort()
+        self._sort_permutations[key] = (permutation, positions)
+        if len(self._sort_permutations) > SORT_CACHE_SIZE:
+            self._sort_permutations.popitem(last=False)
+        return permutation, positions
+
+    def _get_reversed_permutation(
+        self, column: str, permutation: pl.Series
+    ) -> pl.Series:
+        # reversing takes linear time, sorting again doesn't;
+        # nulls stay last and ties keep their row order
+        values: pl.Series = self._original_model[column]  # type: ignore
+        non_null = permutation.head(len(permutation) - values.null_count()).reverse()
+        sorted_values = values.take(non_null)
+        previous = sorted_values.shift(1)
+        tied = sorted_values == previous
+        if values.dtype in pl.FLOAT_DTYPES:
+            tied |= sorted_values.is_nan() & previous.is_nan()
+        starts_tie = ~tied.fill_null(False)
+        # every tie is reversed a second time, back into row order
+        reversed_ties = (
+            pl.DataFrame({"tie": starts_tie.cumsum()})
+            .with_row_count()
+            .select(
+                pl.col("row_nr").min().over("tie")
+                + pl.col("row_nr").max().over("tie")
+                - pl.col("row_nr")
+            )
+            .to_series()
+        )
+        return pl.concat(
+            [non_null.take(reversed_ties), permutation.tail(values.null_count())]
+        )
+
+    def _get_sort_keys(
+        self, sort_by: Iterable[tuple[str, bool]]
+    ) -> tuple[list[pl.Expr], list[bool]]:
+        # nulls come last in both directions like in lazy models,
+        # arg_sort_by has no nulls_last
+        columns = []
+        descending = []
+        for column, column_descending in sort_by:
+            if self._original_model[column].null_count():  # type: ignore
+                columns.append(pl.col(column).is_null().cast(pl.UInt8))
+                descending.append(False)
+            columns.append(pl.col(column))
+            descending.append(column_descending)
+        return columns, descending
+
+    def _sort_column(self, e: ft.ControlEvent) -> None:
+        if self.config.sort:
+            column = self._column_names[e.column_index]  # type: ignore
+            self.sort(column, descending=not e.ascending)  # type: ignore
+        if self.config.on_sort_column:
+            self.config.on_sort_column(e)
+
+    def _render(
+        self,
+        model: pl.DataFrame | pl.LazyFrame,
+        rows: pl.Series | None = None,
+        display_key: tuple | None = None,
+        page_index: int = 0,
+    ) -> None:
+        self._displayed_model = model
+        self._displayed_rows = rows
+        # identifies filter and sort order of the original model, None otherwise
+        self._display_key = display_key
+        self._displayed_count: int | None = None
+        self.page_index = min(page_index, self.page_count - 1)
+        if self.config.row_key and self.config.row_key not in model.columns:
+            raise ValueError(f"row key column {self.config.row_key} not in model")
+        if model.columns != self._column_names:
+            self._column_names = model.columns
+            self._row_controls = {}
+            self._summary_row = None
+            on_sort = (
+                self._sort_column
+                if self.config.sort or self.config.on_sort_column
+                else None
+            )
+            self.data_table.columns = [
+                ft.DataColumn(ft.Text(column), on_sort=on_sort)
+                for column in model.columns
+            ]
+            self.data_table.rows = []
+        self._render_window()
+
+    def go_to_page(self, page_index: int) -> None:
+        # a search finishing on its worker thread renders the table as well
+        with self._search_lock:
+            self.page_index = min(max(page_index, 0), self.page_count - 1)
+            self._render_window()
+
+    def _render_window(self) -> None:
+        tags = self._get_metric_tags()
+        with instrumentation.timed("table_render", **tags):
+            window = self._get_window()
+            self._rows_built = 0
+            if self.config.row_key:
+                rows = self._get_keyed_rows(window)
+            else:
+                rows = self._get_positional_rows(window)
+            if self.config.summary:
+                # the summary is shown on every page, below the rows of the window
+                rows.append(self._get_summary_row())
+            self.data_table.rows = rows
+            if self.config.page_size:
+                self._update_pagination_bar()
+        instrumentation.count("rows_built", self._rows_built, **tags)
+        instrumentation.count("rows_rendered", window.height, **tags)
         if self.page:
-            self.update()
+            with instrumentation.timed("page_update", **tags):
+                self.update()
+
+    def _get_metric_tags(self) -> dict[str, str]:
+        tags = {"control": type(self).__name__}
+        if self.page and self.page.views:
+            # tagged like MvpView.render(), with the view the table is shown in
+            view = self.page.views[-1]
+            tags["route"] = str(view.route)
+            tags["view"] = type(view).__name__
+        return tags
+
+    def _render_appended(self, appended: pl.Series, dropped: int) -> None:
+        # without sorting and pages, the rows of the table are the found rows
+        # in model order, so only the dropped and the new ones change
+        tags = self._get_metric_tags()
+        with instrumentation.timed("table_render", **tags):
+            window = self._format(self._original_model[appended])
+            rows = self.data_table.rows or []
+            if rows and rows[-1] is self._summary_row:
+                rows = rows[:-1]
+            rows = rows[dropped:]
+            self._rows_built = 0
+            new_rows = [self._get_row(values) for values in window.rows()]
+            if self.config.row_key:
+                for key in list(islice(self._row_controls, dropped)):
+                    del self._row_controls[key]
+                key_index = window.columns.index(self.config.row_key)
+                for values, row in zip(window.rows(), new_rows):
+                    self._row_controls[values[key_index]] = row
+            rows.extend(new_rows)
+            if self.config.summary:
+                rows.append(self._get_summary_row())
+            self.data_table.rows = rows
+        instrumentation.count("rows_built", self._rows_built, **tags)
+        instrumentation.count("rows_rendered", window.height, **tags)
+        if self.page:
+            with instrumentation.timed("page_update", **tags):
+                self.update()
+
+    def _get_positional_rows(self, window: pl.DataFrame) -> list[ft.DataRow]:
+        rows = self.data_table.rows or []
+        if rows and rows[-1] is self._summary_row:
+            rows = rows[:-1]
+        new_rows = []
+        for index, values in enumerate(window.rows()):
+            if index < len(rows):
+                self._patch_row(rows[index], values)
+                new_rows.append(rows[index])
+            else:
+                new_rows.append(self._get_row(values))
+        return new_rows
+
+    def _get_keyed_rows(self, window: pl.DataFrame) -> list[ft.DataRow]:
+        key_index = window.columns.index(str(self.config.row_key))
+        row_controls: dict[Any, ft.DataRow] = {}
+        new_rows = []
+        for values in window.rows():
+            key = values[key_index]
+            row = self._row_controls.pop(key, None)
+            if row:
+                self._patch_row(row, values)
+            else:
+                row = self._get_row(values)
+            row_controls[key] = row
+            new_rows.append(row)
+        # rows that left the window are dropped along with their controls
+        self._row_controls = row_controls
+        return new_rows
+
+    def _patch_row(self, row: ft.DataRow, values: tuple) -> None:
+        for cell, value in zip(row.cells, values):
+            text: ft.Text = cell.content  # type: ignore
+            if text.value != value:
+                text.value = value
+
+    def _get_row(self, values: tuple) -> ft.DataRow:
+        self._rows_built += 1
+        return ft.DataRow(
+            [self._get_cell(cell) for cell in values],
+            on_select_changed=self.config.on_select_changed_row,
+            on_long_press=self.config.on_long_press_row,
+        )
+
+    def _get_window(self) -> pl.DataFrame:
+        key = (self._display_key, self.page_index)
+        cached = self._display_key is not None and bool(self.config.column_formats)
+        if cached and key in self._formatted_windows:
+            self._formatted_windows.move_to_end(key)
+            return self._formatted_windows[key]
+        # only the rows of the current page are ever turned into controls
+        model = self._displayed_model
+        rows = self._displayed_rows
+        if self.config.page_size:
+            offset = self.page_index * self.config.page_size
+            if rows is None:
+                model = model.slice(offset, self.config.page_size)
+            else:
+                rows = rows.slice(offset, self.config.page_size)
+        if isinstance(model, pl.LazyFrame):
+            window = self._format(model.collect())
+        elif rows is None:
+            window = self._format(model)
+        else:
+            window = self._format(model[rows])
+        if cached:
+            self._formatted_windows[key] = window
+            if len(self._formatted_windows) > FORMAT_CACHE_SIZE:
+                self._formatted_windows.popitem(last=False)
+        return window
+
+    def _format(self, window: pl.DataFrame) -> pl.DataFrame:
+        # only the rows of the window are formatted, one column at a time
+        formats = self.config.column_formats
+        if not formats:
+            return window
+        return window.with_columns(
+            [
+                formats[column].format(window[column])
+                for column in window.columns
+                if column in formats
+            ]
+        )
 
     def _get_cell(self, text: str) -> ft.DataCell:
         return ft.DataCell(
@@ -146,6 +650,164 @@ class ModelDataTable(ft.UserControl):
             on_tap_down=self.config.on_tap_down_cell,
         )
 
+    def _run_append(self) -> None:
+        with self._search_lock:
+            self._append_timer = None
+            self._append_pending_rows()
+
+    def _append_pending_rows(self) -> None:
+        if not self._pending_rows:
+            return
+        new_rows = pl.concat(self._pending_rows, rechunk=False)
+        self._pending_rows = []
+        previous_height = self._original_model.height
+        model = self._original_model.vstack(new_rows)
+        dropped = 0
+        if self.config.max_rows and model.height > self.config.max_rows:
+            # the oldest rows are dropped, which shifts the position of all others
+            dropped = model.height - self.config.max_rows
+            model = model.slice(dropped)
+        if model.n_chunks() > MAX_CHUNKS:
+            model = model.rechunk()
+        self._original_model = model
+        self._text_columns = self._append_to_columns(
+            self._text_columns, new_rows, dropped, lower=False
+        )
+        self._search_columns = self._append_to_columns(
+            self._search_columns,
+            new_rows,
+            dropped,
+            lower=not self.config.search_case_sensitive,
+        )
+        # indexes can't be extended, they are built again on the next search
+        self._search_indexes = {}
+        self._sort_permutations = OrderedDict()
+        self._formatted_windows = OrderedDict()
+        self._summaries = OrderedDict()
+        self._restart_pending_search()
+
+        start = max(previous_height - dropped, 0)
+        appended = pl.arange(start, model.height, eager=True).cast(pl.UInt32)
+        displayed_dropped = min(dropped, previous_height)
+        if self._search_result:
+            # only the new rows are searched
+            column, query, rows = self._search_result
+            appended = self._filter_rows(appended, query, column)
+            kept: pl.Series = rows.filter(rows >= dropped) - dropped  # type: ignore
+            displayed_dropped = len(rows) - len(kept)  # type: ignore
+            self._search_result = (
+                self._search_result[0],
+                self._search_result[1],
+                pl.concat([kept, appended]),
+            )
+        if self._sort_by or self.config.page_size:
+            self._refresh(self.page_index)
+            return
+        search = self._search_result[:2] if self._search_result else None
+        found_rows = self._search_result[2] if self._search_result else None
+        self._update_summaries(model, found_rows, cache_key=(search,))
+        self._displayed_model = model
+        self._displayed_rows = found_rows
+        self._display_key = ((), search)
+        self._displayed_count = None
+        self._render_appended(appended, displayed_dropped)
+
+    def _append_to_columns(
+        self,
+        columns: dict[str, pl.Series],
+        new_rows: pl.DataFrame,
+        dropped: int,
+        lower: bool,
+    ) -> dict[str, pl.Series]:
+        appended_columns = {}
+        for name, texts in columns.items():
+            new_texts = new_rows[name].cast(pl.Utf8)
+            if lower:
+                new_texts = new_texts.str.to_lowercase()
+            texts = pl.concat([texts, new_texts], rechunk=False)
+            appended_columns[name] = texts.slice(dropped)
+        return appended_columns
+
+    def _update_summaries(
+        self,
+        model: pl.DataFrame | pl.LazyFrame,
+        rows: pl.Series | None = None,
+        cache_key: tuple | None = None,
+    ) -> None:
+        if not self.config.summary:
+            return
+        if cache_key in self._summaries:
+            self._summaries.move_to_end(cache_key)
+            summary, groups = self._summaries[cache_key]
+        else:
+            summary, groups = self._get_summaries(model, rows)
+            if cache_key is not None:
+                self._summaries[cache_key] = (summary, groups)
+                if len(self._summaries) > SUMMARY_CACHE_SIZE:
+                    self._summaries.popitem(last=False)
+        self._summary = summary
+        if groups is not None:
+            self._update_group_table(groups)
+
+    def _get_summaries(
+        self, model: pl.DataFrame | pl.LazyFrame, rows: pl.Series | None
+    ) -> tuple[pl.DataFrame, pl.DataFrame | None]:
+        expressions = []
+        for column, aggregation in (self.config.summary or {}).items():
+            if isinstance(aggregation, str):
+                aggregation = getattr(pl.col(column), aggregation)()
+            expressions.append(aggregation.alias(column))
+        group_by = self.config.summary_group_by
+        if isinstance(model, pl.DataFrame) and rows is not None:
+            # only the columns that are aggregated are gathered for the found rows
+            columns = {
+                name
+                for expression in expressions
+                for name in expression.meta.root_names()
+            }
+            if group_by:
+                columns.add(group_by)
+            if not columns:
+                # e.g. pl.count(), which still needs the number of found rows
+                columns.add(model.columns[0])
+            model = model.select(sorted(columns))[rows]
+        queries = [model.lazy().select(expressions)]
+        if group_by:
+            queries.append(
+                model.lazy().groupby(group_by).agg(expressions).sort(group_by)
+            )
+        # both aggregations are run in parallel
+        summary, *groups = pl.collect_all(queries)
+        return summary, groups[0] if groups else None
+
+    def _get_summary_row(self) -> ft.DataRow:
+        summary = self._format(self._summary)
+        values = tuple(
+            summary[column][0] if column in summary.columns else ""
+            for column in self._column_names
+        )
+        # the row is patched, so it can be told apart from the rows of the model
+        if self._summary_row is None:
+            self._summary_row = ft.DataRow(
+                [
+                    ft.DataCell(ft.Text(value, weight=ft.FontWeight.BOLD))
+                    for value in values
+                ]
+            )
+        else:
+            self._patch_row(self._summary_row, values)
+        return self._summary_row
+
+    def _update_group_table(self, groups: pl.DataFrame) -> None:
+        groups = self._format(groups)
+        self.group_table.columns = [
+            ft.DataColumn(ft.Text(column)) for column in groups.columns
+        ]
+        self.group_table.rows = [
+            ft.DataRow([ft.DataCell(ft.Text(value)) for value in values])
+            for values in groups.rows()
+        ]
+
     def _setup_search_bar(self) -> None:
         self.search_field = self._get_search_field()
         self.column_dropdown = self._get_column_dropdown()
@@ -159,21 +821,65 @@ class ModelDataTable(ft.UserControl):
             padding=ft.padding.all(10.0),
         )
 
+    def _setup_pagination_bar(self) -> None:
+        self.first_page_button = ft.IconButton(
+            ft.icons.FIRST_PAGE, on_click=lambda e: self.go_to_page(0)
+        )
+        self.previous_page_button = ft.IconButton(
+            ft.icons.CHEVRON_LEFT,
+            on_click=lambda e: self.go_to_page(self.page_index - 1),
+        )
+        self.next_page_button = ft.IconButton(
+            ft.icons.CHEVRON_RIGHT,
+            on_click=lambda e: self.go_to_page(self.page_index + 1),
+        )
+        self.last_page_button = ft.IconButton(
+            ft.icons.LAST_PAGE,
+            on_click=lambda e: self.go_to_page(self.page_count - 1),
+        )
+        self.pagination_text = ft.Text()
+        self.pagination_bar = ft.Container(
+            ft.Row(
+                [
+                    self.pagination_text,
+                    self.first_page_button,
+                    self.previous_page_button,
+                    self.next_page_button,
+                    self.last_page_button,
+                ],
+                alignment=ft.MainAxisAlignment.END,
+            ),
+            padding=ft.padding.all(10.0),
+        )
+
+    def _update_pagination_bar(self) -> None:
+        page_size = int(self.config.page_size or 0)
+        total = self._displayed_height
+        start = min(self.page_index * page_size, total)
+        end = min(start + page_size, total)
+        self.pagination_text.value = f"{start + 1 if total else 0}-{end} of {total}"
+        on_first_page = self.page_index == 0
+        on_last_page = self.page_index >= self.page_count - 1
+        self.first_page_button.disabled = on_first_page
+        self.previous_page_button.disabled = on_first_page
+        self.next_page_button.disabled = on_last_page
+        self.last_page_button.disabled = on_last_page
+
     def _get_column_dropdown(self) -> ft.Dropdown:
         options = [
             ft.dropdown.Option(column_name, column_name)
-            for column_name in self._text_model.columns
+            for column_name in self._original_model.columns
         ]
-        return ft.Dropdown(
-            options=options,
-            value=str(options[self.config.search_column_default_index].key),
-        )
+        value = str(options[self.config.search_column_default_index].key)
+        if self.config.search_all_columns:
+            options.insert(0, ft.dropdown.Option(ALL_COLUMNS, "All columns"))
+        return ft.Dropdown(options=options, value=value)
 
     def _get_search_field(self) -> ft.Container:
         def clear(e: ft.ControlEvent) -> None:
             search_field.value = ""
             if self.page:
-                self.render_model(self._text_model)
+                self._start_search("", debounce=None)
                 search_field.focus()
 
         search_field = ft.TextField(expand=True, on_change=self._filter_model)
@@ -181,14 +887,181 @@ class ModelDataTable(ft.UserControl):
         return ft.Container(ft.Row([search_field, clear_button]), expand=True)
 
     def _filter_model(self, e: ft.ControlEvent) -> None:
-        query = e.control.value
-        if not query:
-            self.render_model(self._text_model)
+        self._start_search(e.control.value, debounce=self.config.search_debounce)
+
+    def _start_search(self, query: str, debounce: float | None) -> None:
+        column = str(self.column_dropdown.value)
+        with self._search_lock:
+            self._search_generation += 1
+            generation = self._search_generation
+            if self._search_timer:
+                self._search_timer.cancel()
+                self._search_timer = None
+            if debounce is None:
+                self._apply_search(query, column)
+                return
+            self._search_timer = threading.Timer(
+                debounce, self._run_search, (generation, query, column)
+            )
+            self._search_timer.daemon = True
+            self._search_timer.start()
+
+    def _run_search(self, generation: int, query: str, column: str) -> None:
+        if generation != self._search_generation:
             return
-        filtered_model = self._text_model.filter(
-            pl.col(str(self.column_dropdown.value)).str.contains(query, literal=True)
-        )
-        self.render_model(filtered_model)
+        rows = self._search(query, column)
+        with self._search_lock:
+            # a newer query or model arrived while this one was running
+            if generation != self._search_generation:
+                return
+            self._apply_search(query, column, rows)
+
+    def _restart_pending_search(self) -> None:
+        if self._search_timer and self._search_timer.is_alive():
+            # a search still waiting or running for the previous rows starts over
+            self._search_timer.cancel()
+            self._search_generation += 1
+            _, query, column = self._search_timer.args
+            self._search_timer = threading.Timer(
+                0, self._run_search, (self._search_generation, query, column)
+            )
+            self._search_timer.daemon = True
+            self._search_timer.start()
+
+    def _apply_search(
+        self, query: str, column: str, rows: pl.Series | None = None
+    ) -> None:
+        if not query and not self._filters:
+            self._search_result = None
+        else:
+            if rows is None:
+                rows = self._search(query, column)
+            self._search_result = (column, query, rows)
+        # rows are taken from the original model to keep row keys and values typed,
+        # so row controls can be matched against the ones already rendered
+        self._refresh()
+
+    def _search(self, query: str, column: str) -> pl.Series | None:
+        if isinstance(self._original_model, pl.LazyFrame):
+            # the filter becomes part of the lazy query instead
+            return None
+        predicates, text = self._parse_query(query)
+        previous = self._search_result
+        if previous and previous[0] == column:
+            previous_predicates, previous_text = self._parse_query(previous[1])
+            if previous_predicates == predicates and previous_text in text:
+                # every match of the new query is a match of the previous one
+                rows: pl.Series | None = previous[2]
+                if text and rows is not None:
+                    rows = rows.filter(self._match(text, column, rows))
+                return rows
+        rows = None
+        if text and self.config.search_index:
+            rows = self._search_with_index(text, column)
+        if text and rows is None:
+            rows = self._match(text, column).arg_true()
+        expression = get_filter_expression(predicates)
+        if expression is None:
+            if rows is None:
+                return pl.arange(
+                    0, self._original_model.height, eager=True, dtype=pl.UInt32
+                )
+            return rows
+        # all predicates are evaluated in one pass over the typed columns
+        mask = self._original_model.select(expression).to_series()
+        if rows is None:
+            return mask.arg_true()
+        return rows.filter(mask.take(rows))
+
+    def _filter_rows(self, rows: pl.Series, query: str, column: str) -> pl.Series:
+        predicates, text = self._parse_query(query)
+        if text:
+            rows = rows.filter(self._match(text, column, rows))
+        expression = get_filter_expression(predicates)
+        if expression is not None:
+            model: pl.DataFrame = self._original_model[rows]  # type: ignore
+            rows = rows.filter(model.select(expression).to_series())
+        return rows
+
+    def _parse_query(self, query: str) -> tuple[list[Predicate], str]:
+        # the predicates of the filters and the query, and the text to search for
+        predicates: list[Predicate] = []
+        if self.config.search_query_syntax:
+            predicates, query = parse_query(
+                query, self._original_model.schema, self.config.search_case_sensitive
+            )
+        if not self.config.search_case_sensitive:
+            query = query.lower()
+        return [*self._filters, *predicates], query
+
+    def _search_with_index(self, query: str, column: str) -> pl.Series | None:
+        results = []
+        for name in self._get_searched_columns(column):
+            rows = self._get_search_index(name).search(query)
+            if rows is None:
+                return None
+            results.append(rows)
+        if len(results) == 1:
+            return results[0]
+        return pl.concat(results).unique().sort()
+
+    def _match(
+        self, query: str, column: str, rows: pl.Series | None = None
+    ) -> pl.Series:
+        mask: pl.Series | None = None
+        for name in self._get_searched_columns(column):
+            texts = self._get_search_column(name)
+            if rows is not None:
+                texts = texts.take(rows)
+            column_mask = texts.str.contains(query, literal=True)
+            mask = column_mask if mask is None else mask | column_mask
+        return mask  # type: ignore
+
+    def _get_search_expression(self, query: str, column: str) -> pl.Expr:
+        predicates, text = self._parse_query(query)
+        expression = get_filter_expression(predicates)
+        if not text:
+            return pl.lit(True) if expression is None else expression
+        expressions = []
+        for name in self._get_searched_columns(column):
+            texts = pl.col(name).cast(pl.Utf8)
+            if not self.config.search_case_sensitive:
+                texts = texts.str.to_lowercase()
+            expressions.append(texts.str.contains(text, literal=True))
+        text_expression = reduce(lambda left, right: left | right, expressions)
+        if expression is None:
+            return text_expression
+        return expression & text_expression
+
+    def _get_searched_columns(self, column: str) -> list[str]:
+        if column == ALL_COLUMNS:
+            return self._original_model.columns
+        return [column]
+
+    # Text representations are only built for columns that are actually searched.
+    # Each cache is looked up before the model so that a search running
+    # while the model is replaced never stores old columns in the new cache.
+
+    def _get_text_column(self, column: str) -> pl.Series:
+        text_columns = self._text_columns
+        if column not in text_columns:
+            text_columns[column] = self._original_model[column].cast(pl.Utf8)
+        return text_columns[column]
+
+    def _get_search_column(self, column: str) -> pl.Series:
+        search_columns = self._search_columns
+        if column not in search_columns:
+            texts = self._get_text_column(column)
+            if not self.config.search_case_sensitive:
+                texts = texts.str.to_lowercase()
+            search_columns[column] = texts
+        return search_columns[column]
+
+    def _get_search_index(self, column: str) -> TrigramIndex:
+        search_indexes = self._search_indexes
+        if column not in search_indexes:
+            search_indexes[column] = TrigramIndex(self._get_search_column(column))
+        return search_indexes[column]
 
 
 def main(page: ft.Page) -> None:
@@ -208,4 +1081,5 @@ def main(page: ft.Page) -> None:
     page.update()
 
 
-ft.app(target=main)
+if __name__ == "__main__":
+    ft.app(target=main)
@@ -0,0 +1,78 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+import polars as pl
+
+from fletched.executors import get_executor
+
+EXPORT_WORKERS = 2
+EXPORT_CHUNK_SIZE = 100_000
+EXPORT_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+
+def get_export_executor() -> ThreadPoolExecutor:
+    return get_executor("export", EXPORT_WORKERS)
+
+
+def get_export_format(path: Path) -> str:
+    try:
+        return EXPORT_FORMATS[path.suffix.lower()]
+    except KeyError:
+        raise ValueError(f"unknown export format of {path}") from None
+
+
+def export_view(
+    view: pl.DataFrame | pl.LazyFrame,
+    rows: pl.Series | None,
+    path: Path,
+    file_format: str,
+    on_progress: Callable[[float], None] | None = None,
+    sink: bool = False,
+) -> Path:
+    if file_format not in EXPORT_FORMATS.values():
+        raise ValueError(f"unknown export format {file_format}")
+    if isinstance(view, pl.LazyFrame):
+        if sink and file_format == "parquet":
+            # never held in memory as a whole, but only possible for queries
+            # the streaming engine supports
+            try:
+                view.sink_parquet(path)
+            except (pl.ComputeError, pl.InvalidOperationError):
+                # e.g. a sort or join the model was created with
+                pass
+            else:
+                _report_progress(on_progress, 1.0)
+                return path
+        view = view.collect(streaming=True)
+    if file_format == "parquet":
+        # polars can't append row groups to a parquet file
+        (view if rows is None else view[rows]).write_parquet(path)
+        _report_progress(on_progress, 1.0)
+        return path
+
+    height = view.height if rows is None else len(rows)
+    with open(path, "wb") as file:
+        # at least one chunk, so an empty csv file still gets its header
+        for offset in range(0, max(height, 1), EXPORT_CHUNK_SIZE):
+            if rows is None:
+                chunk = view.slice(offset, EXPORT_CHUNK_SIZE)
+            else:
+                chunk = view[rows.slice(offset, EXPORT_CHUNK_SIZE)]
+            if file_format == "csv":
+                chunk.write_csv(file, has_header=offset == 0)
+            else:
+                chunk.write_ndjson(file)
+            written = min(offset + EXPORT_CHUNK_SIZE, height)
+            _report_progress(on_progress, written / height if height else 1.0)
+    return path
+
+
+def _report_progress(on_progress: Callable[[float], None] | None, done: float) -> None:
+    if on_progress:
+        on_progress(done)
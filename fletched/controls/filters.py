@@ -0,0 +1,163 @@
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import reduce
+from typing import Any
+
+import polars as pl
+
+# column, operator and value of e.g. price>=100 or name:"Jane Doe",
+# everything else is searched as text
+QUERY_PATTERN = re.compile(r'(?:([^\s:<>=~"]+)(>=|<=|>|<|=|:|~)("[^"]*"|\S+))|(\S+)')
+
+
+class Predicate(ABC):
+    @abstractmethod
+    def get_expression(self) -> pl.Expr:
+        ...
+
+
+@dataclass(frozen=True)
+class Range(Predicate):
+    column: str
+    min: Any = None
+    max: Any = None
+    include_min: bool = True
+    include_max: bool = True
+
+    def get_expression(self) -> pl.Expr:
+        value = pl.col(self.column)
+        conditions = [value.is_not_null()]
+        if self.min is not None:
+            conditions.append(
+                value >= self.min if self.include_min else value > self.min
+            )
+        if self.max is not None:
+            conditions.append(
+                value <= self.max if self.include_max else value < self.max
+            )
+        return reduce(lambda left, right: left & right, conditions)
+
+
+@dataclass(frozen=True)
+class OneOf(Predicate):
+    column: str
+    values: tuple
+    case_sensitive: bool = True
+
+    def get_expression(self) -> pl.Expr:
+        if not self.case_sensitive:
+            return (
+                pl.col(self.column)
+                .str.to_lowercase()
+                .is_in([value.lower() for value in self.values])
+            )
+        return pl.col(self.column).is_in(list(self.values))
+
+
+@dataclass(frozen=True)
+class Matches(Predicate):
+    column: str
+    pattern: str
+
+    def get_expression(self) -> pl.Expr:
+        return pl.col(self.column).cast(pl.Utf8).str.contains(self.pattern)
+
+
+@dataclass(frozen=True)
+class IsNull(Predicate):
+    column: str
+    null: bool = True
+
+    def get_expression(self) -> pl.Expr:
+        value = pl.col(self.column)
+        return value.is_null() if self.null else value.is_not_null()
+
+
+def get_filter_expression(predicates: list[Predicate]) -> pl.Expr | None:
+    if not predicates:
+        return None
+    return reduce(
+        lambda left, right: left & right,
+        [predicate.get_expression() for predicate in predicates],
+    )
+
+
+def parse_query(
+    query: str, schema: dict[str, pl.PolarsDataType], case_sensitive: bool = True
+) -> tuple[list[Predicate], str]:
+    predicates = []
+    # the text between filters is kept as typed, e.g. with several spaces
+    texts = []
+    text_start = 0
+    for match in QUERY_PATTERN.finditer(query):
+        column, operator, value, text = match.groups()
+        if text is not None or column not in schema:
+            continue
+        try:
+            predicates.append(
+                _get_predicate(
+                    column, operator, value.strip('"'), schema, case_sensitive
+                )
+            )
+        except (ValueError, pl.ComputeError):
+            # not meant as a filter, e.g. a time like 12:30
+            continue
+        texts.append(query[text_start : match.start()].rstrip())
+        text_start = match.end()
+    texts.append(query[text_start:])
+    return predicates, "".join(texts).strip()
+
+
+def _get_predicate(
+    column: str,
+    operator: str,
+    value: str,
+    schema: dict[str, pl.PolarsDataType],
+    case_sensitive: bool,
+) -> Predicate:
+    dtype = schema[column]
+    if operator == "~":
+        pattern = value if case_sensitive else f"(?i){value}"
+        # polars' regex engine, which doesn't support e.g. look-arounds
+        pl.Series([""]).str.contains(pattern)
+        return Matches(column, pattern)
+    if operator in (">", ">="):
+        return Range(column, min=_parse(value, dtype), include_min=operator == ">=")
+    if operator in ("<", "<="):
+        return Range(column, max=_parse(value, dtype), include_max=operator == "<=")
+    if operator == ":" and value in ("null", "!null"):
+        return IsNull(column, value == "null")
+    if operator == ":" and ".." in value:
+        start, end = value.split("..", 1)
+        return Range(
+            column,
+            min=_parse(start, dtype) if start else None,
+            max=_parse(end, dtype) if end else None,
+        )
+    # text is compared like the free text search, numbers and dates are not
+    text_case_sensitive = case_sensitive or dtype != pl.Utf8
+    if operator == ":":
+        return OneOf(
+            column,
+            tuple(_parse(item, dtype) for item in value.split(",")),
+            text_case_sensitive,
+        )
+    return OneOf(column, (_parse(value, dtype),), text_case_sensitive)
+
+
+def _parse(value: str, dtype: pl.PolarsDataType) -> Any:
+    if dtype in pl.INTEGER_DTYPES:
+        return int(value)
+    if dtype in pl.FLOAT_DTYPES:
+        return float(value)
+    if dtype == pl.Date:
+        return date.fromisoformat(value)
+    if dtype == pl.Datetime:
+        return datetime.fromisoformat(value)
+    if dtype == pl.Boolean:
+        if value.lower() not in ("true", "false"):
+            raise ValueError(f"{value} is not a boolean")
+        return value.lower() == "true"
+    return value
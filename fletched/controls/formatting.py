@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+
+import polars as pl
+
+UNSIGNED_DTYPES = (pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64)
+
+
+@dataclass(frozen=True)
+class ColumnFormat:
+    precision: int | None = None
+    thousands_separator: str = ""
+    decimal_separator: str = "."
+    date_format: str | None = None
+    max_length: int | None = None
+    ellipsis: str = "…"
+    null_value: str = ""
+
+    def format(self, values: pl.Series) -> pl.Series:
+        if values.dtype in pl.TEMPORAL_DTYPES and self.date_format:
+            texts = values.dt.strftime(self.date_format)
+        elif values.dtype in pl.NUMERIC_DTYPES:
+            texts = self._format_numbers(values)
+        else:
+            texts = values.cast(pl.Utf8)
+        if self.max_length is not None:
+            texts = self._truncate(texts)
+        return texts.fill_null(self.null_value).alias(values.name)
+
+    # Every step works on all values at once. Series are used instead of
+    # expressions because polars would evaluate shared subexpressions again
+    # for every place they are used in.
+
+    def _format_numbers(self, values: pl.Series) -> pl.Series:
+        texts = values.cast(pl.Utf8)
+        negative = values < 0
+        decimals: pl.Series | None = None
+        if values.dtype in pl.INTEGER_DTYPES:
+            # unsigned integers, e.g. counts of a summary, are never negative
+            unsigned = values.dtype in UNSIGNED_DTYPES
+            integers = texts if unsigned else values.abs().cast(pl.Utf8)
+            if self.precision:
+                decimals = pl.repeat("0" * self.precision, len(values), eager=True)
+        elif self.precision is not None:
+            scale = 10**self.precision
+            scaled = (values.abs() * scale).round(0)
+            # null for nan, inf and numbers too large for an integer
+            integers = (scaled // scale).cast(pl.Int64, strict=False).cast(pl.Utf8)
+            if self.precision:
+                decimals = (
+                    (scaled % scale)
+                    .cast(pl.Int64, strict=False)
+                    .cast(pl.Utf8)
+                    .str.zfill(self.precision)
+                )
+            negative = negative & (scaled > 0)
+        else:
+            parts = values.abs().cast(pl.Utf8).str.split_exact(".", 1).struct
+            scientific = texts.str.contains("e", literal=True)
+            integers = parts.field("field_0").set(scientific, None)  # type: ignore
+            decimals = parts.field("field_1")
+        if self.thousands_separator:
+            integers = self._group_thousands(integers)
+        pieces = [
+            pl.Series(["", "-"]).take(negative.fill_null(False).cast(pl.UInt32)),
+            integers,
+        ]
+        if decimals is not None:
+            pieces.append((self.decimal_separator + decimals).fill_null(""))
+        formatted = self._concat(pieces)
+        # nan, inf and numbers in scientific notation are shown as they are
+        return formatted.zip_with(integers.is_not_null(), texts)
+
+    def _group_thousands(self, digits: pl.Series) -> pl.Series:
+        # padded to the same number of whole groups of three,
+        # leading groups of zeros are stripped again after joining them
+        width = -(-int(digits.str.n_chars().max() or 0) // 3) * 3
+        padded = digits.str.zfill(width)
+        groups = [padded.str.slice(offset, 3) for offset in range(0, width, 3)]
+        if not groups:
+            return digits
+        grouped = self._concat(groups, self.thousands_separator).str.lstrip(
+            "0" + self.thousands_separator
+        )
+        return grouped.set(grouped == "", "0")  # type: ignore
+
+    def _truncate(self, texts: pl.Series) -> pl.Series:
+        max_length = int(self.max_length or 0)
+        length = max(max_length - len(self.ellipsis), 0)
+        truncated = texts.str.slice(0, length) + self.ellipsis
+        return truncated.zip_with(texts.str.n_chars() > max_length, texts)
+
+    def _concat(self, pieces: list[pl.Series], separator: str = "") -> pl.Series:
+        frame = pl.DataFrame([piece.alias(str(i)) for i, piece in enumerate(pieces)])
+        return frame.select(pl.concat_str(pl.all(), separator=separator)).to_series()
@@ -0,0 +1,60 @@
+import polars as pl
+
+GRAM_LENGTH = 3
+
+
+class TrigramIndex:
+    def __init__(self, texts: pl.Series) -> None:
+        self.texts = texts
+        grams = self._get_grams(texts)
+        self._gram_to_position = {
+            gram: position for position, gram in enumerate(grams["gram"].to_list())
+        }
+        self._postings = grams["row"]
+
+    def search(self, query: str) -> pl.Series | None:
+        if len(query) < GRAM_LENGTH:
+            return None
+        positions = []
+        for gram in {query[i : i + GRAM_LENGTH] for i in range(len(query) - 2)}:
+            position = self._gram_to_position.get(gram)
+            if position is None:
+                return pl.Series("row", [], dtype=pl.UInt32)
+            positions.append(position)
+
+        postings = sorted((self._postings[position] for position in positions), key=len)
+        rows = postings[0]
+        for posting in postings[1:]:
+            rows = rows.filter(rows.is_in(posting))
+        # all trigrams being present doesn't mean they are adjacent
+        candidates = self.texts.take(rows)
+        return rows.filter(candidates.str.contains(query, literal=True))
+
+    @staticmethod
+    def _get_grams(texts: pl.Series) -> pl.DataFrame:
+        frame = (
+            pl.DataFrame({"text": texts})
+            .with_row_count("row")
+            .with_columns(pl.col("text").str.n_chars().alias("length"))
+        )
+        parts = []
+        offset = 0
+        while True:
+            # rows too short for this offset are too short for all further ones
+            frame = frame.filter(pl.col("length") >= offset + GRAM_LENGTH)
+            if frame.is_empty():
+                break
+            parts.append(
+                frame.select(
+                    pl.col("row"),
+                    pl.col("text").str.slice(offset, GRAM_LENGTH).alias("gram"),
+                )
+            )
+            offset += 1
+
+        if not parts:
+            return pl.DataFrame(
+                {"gram": [], "row": []},
+                schema={"gram": pl.Utf8, "row": pl.List(pl.UInt32)},
+            )
+        return pl.concat(parts).groupby("gram").agg(pl.col("row").unique().sort())
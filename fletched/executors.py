@@ -0,0 +1,16 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    # shared by all sessions, so background work never uses more than a few threads
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = _executors[name] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=f"fletched-{name}"
+            )
+        return executor
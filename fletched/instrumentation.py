@@ -0,0 +1,141 @@
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Callable
+
+TIMING = "timing"
+COUNT = "count"
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+Tags = tuple[tuple[str, str], ...]
+Hook = Callable[[str, str, float, dict[str, str]], None]
+
+
+@dataclass
+class Histogram:
+    buckets: tuple[float, ...] = BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+
+    def __post_init__(self) -> None:
+        # the last bucket counts everything above the largest bound
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        # upper bound of the bucket the quantile falls into
+        rank = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.buckets, self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class MetricsRegistry:
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS) -> None:
+        self.buckets = buckets
+        self.histograms: dict[tuple[str, Tags], Histogram] = {}
+        self.counters: dict[tuple[str, Tags], float] = {}
+        self._lock = threading.Lock()
+
+    def __call__(
+        self, kind: str, name: str, value: float, tags: dict[str, str]
+    ) -> None:
+        key = (name, tuple(sorted(tags.items())))
+        with self._lock:
+            if kind == TIMING:
+                histogram = self.histograms.get(key)
+                if histogram is None:
+                    histogram = self.histograms[key] = Histogram(self.buckets)
+                histogram.observe(value)
+            else:
+                self.counters[key] = self.counters.get(key, 0) + value
+
+    def histogram(self, name: str, **tags: str) -> Histogram | None:
+        return self.histograms.get((name, tuple(sorted(tags.items()))))
+
+    def counter(self, name: str, **tags: str) -> float:
+        return self.counters.get((name, tuple(sorted(tags.items()))), 0)
+
+    def snapshot(self) -> dict[str, list[dict]]:
+        with self._lock:
+            return {
+                "timings": [
+                    {
+                        "name": name,
+                        "tags": dict(tags),
+                        "count": histogram.count,
+                        "mean": histogram.mean,
+                        "p50": histogram.quantile(0.5),
+                        "p95": histogram.quantile(0.95),
+                        "max": histogram.max,
+                    }
+                    for (name, tags), histogram in self.histograms.items()
+                ],
+                "counts": [
+                    {"name": name, "tags": dict(tags), "value": value}
+                    for (name, tags), value in self.counters.items()
+                ],
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+
+enabled = True
+registry = MetricsRegistry()
+hooks: list[Hook] = [registry]
+
+
+def add_hook(hook: Hook) -> None:
+    hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    hooks.remove(hook)
+
+
+class timed:
+    # a plain class is noticeably cheaper than a contextmanager generator
+    __slots__ = ("stage", "tags", "start")
+
+    def __init__(self, stage: str, **tags: str) -> None:
+        self.stage = stage
+        self.tags = tags
+
+    def __enter__(self) -> dict[str, str]:
+        # tags can still be added to the returned dict, e.g. once a route was matched
+        self.start = time.perf_counter()
+        return self.tags
+
+    def __exit__(self, *exc_info) -> None:
+        if enabled:
+            _emit(TIMING, self.stage, time.perf_counter() - self.start, self.tags)
+
+
+def count(name: str, value: float = 1, **tags: str) -> None:
+    if enabled:
+        _emit(COUNT, name, value, tags)
+
+
+def _emit(kind: str, name: str, value: float, tags: dict[str, str]) -> None:
+    for hook in hooks:
+        hook(kind, name, value, tags)
@@ -0,0 +1,26 @@
+import importlib
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package_globals: dict[str, Any], exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    # returns a module level __getattr__ and __dir__ for a package,
+    # so exported names are only imported from their module on first access
+    package_name = package_globals["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        module = importlib.import_module(module_name)
+        value = (
+            module if module_name == f"{package_name}.{name}" else getattr(module, name)
+        )
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*package_globals, *exports})
+
+    return __getattr__, __dir__
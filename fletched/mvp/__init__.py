@@ -1,8 +1,56 @@
-from fletched.mvp.datasource import MvpDataSource
-from fletched.mvp.dialog import DialogConfig, MvpDialog
-from fletched.mvp.error import ErrorMessage
-from fletched.mvp.model import MvpModel
-from fletched.mvp.observable import Observable
-from fletched.mvp.presenter import MvpPresenter
-from fletched.mvp.protocols import MvpPresenterProtocol, MvpViewProtocol
-from fletched.mvp.view import MvpView, MvpViewBuilder, ViewConfig
+from typing import TYPE_CHECKING
+
+from fletched.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from fletched.mvp.async_datasource import AsyncMvpDataSource
+    from fletched.mvp.batch import UpdateBatch, batch_updates
+    from fletched.mvp.cache import ModelCache
+    from fletched.mvp.datasource import MvpDataSource
+    from fletched.mvp.dialog import DialogConfig, MvpDialog
+    from fletched.mvp.error import ErrorMessage
+    from fletched.mvp.model import MvpModel
+    from fletched.mvp.observable import Observable
+    from fletched.mvp.presenter import MvpPresenter
+    from fletched.mvp.protocols import MvpPresenterProtocol, MvpViewProtocol
+    from fletched.mvp.view import MvpView, MvpViewBuilder, ViewConfig
+
+__all__ = [
+    "AsyncMvpDataSource",
+    "DialogConfig",
+    "ErrorMessage",
+    "ModelCache",
+    "MvpDataSource",
+    "MvpDialog",
+    "MvpModel",
+    "MvpPresenter",
+    "MvpPresenterProtocol",
+    "MvpView",
+    "MvpViewBuilder",
+    "MvpViewProtocol",
+    "Observable",
+    "UpdateBatch",
+    "ViewConfig",
+    "batch_updates",
+]
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "AsyncMvpDataSource": "fletched.mvp.async_datasource",
+        "UpdateBatch": "fletched.mvp.batch",
+        "batch_updates": "fletched.mvp.batch",
+        "ModelCache": "fletched.mvp.cache",
+        "MvpDataSource": "fletched.mvp.datasource",
+        "DialogConfig": "fletched.mvp.dialog",
+        "MvpDialog": "fletched.mvp.dialog",
+        "ErrorMessage": "fletched.mvp.error",
+        "MvpModel": "fletched.mvp.model",
+        "Observable": "fletched.mvp.observable",
+        "MvpPresenter": "fletched.mvp.presenter",
+        "MvpPresenterProtocol": "fletched.mvp.protocols",
+        "MvpViewProtocol": "fletched.mvp.protocols",
+        "MvpView": "fletched.mvp.view",
+        "MvpViewBuilder": "fletched.mvp.view",
+        "ViewConfig": "fletched.mvp.view",
+    },
+)
@@ -0,0 +1,94 @@
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import TYPE_CHECKING, Coroutine
+
+from abstractcp import Abstract
+from pydantic import BaseModel
+
+from fletched.mvp.datasource import MvpDataSource
+
+if TYPE_CHECKING:
+    from fletched.routed_app import RoutedApp
+
+Task = concurrent.futures.Future
+
+logger = logging.getLogger(__name__)
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="fletched-event-loop", daemon=True
+            ).start()
+        return _loop
+
+
+class AsyncMvpDataSource(MvpDataSource, Abstract):
+    def __init__(
+        self, *, app: "RoutedApp | None", route_params: dict[str, str]
+    ) -> None:
+        super().__init__(app=app, route_params=route_params)
+        self.loaded = False
+        self._load_task: Task | None = None
+        self._tasks: set[Task] = set()
+
+    @property
+    def loading(self) -> bool:
+        return self._load_task is not None and not self._load_task.done()
+
+    async def load_model_async(self) -> dict | None:
+        return None
+
+    def load(self) -> None:
+        if self.loaded or self.loading:
+            return
+        self._load_task = self.run_task(self._load())
+
+    def reload(self) -> None:
+        if self._load_task:
+            self._load_task.cancel()
+        self.loaded = False
+        self.load()
+
+    def run_task(self, coroutine: Coroutine) -> Task:
+        # views are rendered with the sync page.update(), which flet's async mode
+        # doesn't support, so tasks never run on the loop of a session
+        task = asyncio.run_coroutine_threadsafe(coroutine, get_event_loop())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def cancel(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+
+    def _load_initial_model(self) -> None:
+        # the model is loaded in the background once the view has been rendered
+        pass
+
+    async def _load(self) -> None:
+        try:
+            if self.model_cache is None:
+                model = self._build_loaded_model(await self.load_model_async())
+            else:
+                model = await self.model_cache.get_or_load_async(
+                    type(self), self.route_params, self._load_model
+                )
+        except Exception:
+            # nobody waits for the task, so the error would go unnoticed
+            logger.exception("loading the model of %s failed", type(self).__name__)
+            return
+        if model is not None:
+            self._replace_model(model)
+        self.loaded = True
+
+    async def _load_model(self) -> BaseModel | None:
+        return self._build_loaded_model(await self.load_model_async())
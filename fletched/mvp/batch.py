@@ -0,0 +1,75 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Iterator
+
+from fletched import instrumentation
+
+if TYPE_CHECKING:
+    import flet as ft
+
+    from fletched.mvp.observable import Observable
+
+
+class UpdateBatch:
+    def __init__(self) -> None:
+        self._changes: dict["Observable", set[str] | None] = {}
+        self._pages: list["ft.Page"] = []
+
+    def add_changes(
+        self, observable: "Observable", changed_fields: set[str] | None
+    ) -> None:
+        if observable not in self._changes:
+            self._changes[observable] = (
+                None if changed_fields is None else set(changed_fields)
+            )
+            return
+        previous_fields = self._changes[observable]
+        if previous_fields is None or changed_fields is None:
+            self._changes[observable] = None
+        else:
+            previous_fields.update(changed_fields)
+
+    def add_page(self, page: "ft.Page") -> None:
+        if not any(added_page is page for added_page in self._pages):
+            self._pages.append(page)
+
+    def flush(self) -> None:
+        # observers may cause further notifications, those are merged as well
+        while self._changes:
+            changes = self._changes
+            self._changes = {}
+            for observable, changed_fields in changes.items():
+                observable._notify(changed_fields)
+        pages = self._pages
+        self._pages = []
+        for page in pages:
+            with instrumentation.timed("page_update"):
+                page.update()
+
+
+_current_batch: ContextVar[UpdateBatch | None] = ContextVar(
+    "current_batch", default=None
+)
+
+
+def current_batch() -> UpdateBatch | None:
+    return _current_batch.get()
+
+
+@contextmanager
+def batch_updates() -> Iterator[UpdateBatch]:
+    batch = _current_batch.get()
+    if batch:
+        # nested batches are part of the outermost one
+        yield batch
+        return
+
+    batch = UpdateBatch()
+    token = _current_batch.set(batch)
+    try:
+        yield batch
+    finally:
+        try:
+            batch.flush()
+        finally:
+            _current_batch.reset(token)
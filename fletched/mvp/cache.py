@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class ModelCache:
+    def __init__(self, max_size: int = 128, ttl: float | None = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        self._pending: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(
+        self,
+        data_source_class: type,
+        route_params: dict[str, str],
+        loader: Callable[[], Any],
+    ) -> Any:
+        key = self._get_key(data_source_class, route_params)
+        while True:
+            future, owner = self._claim(key)
+            if owner:
+                try:
+                    self._resolve(key, future, loader())
+                except Exception as exception:
+                    self._reject(key, future, exception)
+            try:
+                return future.result()
+            except CancelledError:
+                # the session that was loading navigated away, take over
+                continue
+
+    async def get_or_load_async(
+        self,
+        data_source_class: type,
+        route_params: dict[str, str],
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        # asyncio is only imported by the apps that actually need it
+        import asyncio
+
+        key = self._get_key(data_source_class, route_params)
+        while True:
+            future, owner = self._claim(key)
+            if owner:
+                try:
+                    self._resolve(key, future, await loader())
+                except asyncio.CancelledError:
+                    self._reject(key, future, None)
+                    raise
+                except Exception as exception:
+                    self._reject(key, future, exception)
+            try:
+                # cancelling this task must not cancel the load for other sessions
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                if owner or not future.cancelled():
+                    raise
+
+    def invalidate(
+        self,
+        data_source_class: type | None = None,
+        route_params: dict[str, str] | None = None,
+    ) -> None:
+        with self._lock:
+            keys = [*self._entries, *self._pending]
+            if data_source_class is not None and route_params is not None:
+                keys = [self._get_key(data_source_class, route_params)]
+            elif data_source_class is not None:
+                keys = [key for key in keys if key[0] is data_source_class]
+            for key in keys:
+                self._entries.pop(key, None)
+                # loads that are still running are not cached when they finish
+                self._pending.pop(key, None)
+
+    def _claim(self, key: Hashable) -> tuple[Future, bool]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    future: Future = Future()
+                    future.set_result(value)
+                    return future, False
+                del self._entries[key]
+
+            future = self._pending.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._pending[key] = future
+            return future, True
+
+    def _resolve(self, key: Hashable, future: Future, value: Any) -> None:
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+                expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+                self._entries[key] = (value, expires_at)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        future.set_result(value)
+
+    def _reject(
+        self, key: Hashable, future: Future, exception: Exception | None
+    ) -> None:
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+        if exception is None:
+            future.cancel()
+        else:
+            future.set_exception(exception)
+
+    @staticmethod
+    def _get_key(data_source_class: type, route_params: dict[str, str]) -> Hashable:
+        return (data_source_class, tuple(sorted(route_params.items())))
@@ -1,46 +1,164 @@
+from typing import TYPE_CHECKING, Iterable
+
 from abstractcp import Abstract, abstract_class_property
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ValidationError, validate_model
 
+from fletched.mvp.cache import ModelCache
 from fletched.mvp.error import ErrorMessage
 from fletched.mvp.observable import Observable
-from fletched.routed_app import RoutedApp
+
+if TYPE_CHECKING:
+    from fletched.routed_app import RoutedApp
 
 
 class MvpDataSource(Abstract, Observable):
     current_model = abstract_class_property(BaseModel)
+    model_cache: ModelCache | None = None
 
-    def __init__(self, *, app: RoutedApp | None, route_params: dict[str, str]) -> None:
+    def __init__(
+        self, *, app: "RoutedApp | None", route_params: dict[str, str]
+    ) -> None:
         super().__init__()
         self.model_class = type(self.current_model)
         self.route_params = route_params
         if app:
             self.app = app
             self.page = app.page
+        self._load_initial_model()
 
     @property
     def route_params_valid(self) -> bool:
         ...
 
+    @classmethod
+    def invalidate_cached_model(
+        cls, route_params: dict[str, str] | None = None
+    ) -> None:
+        if cls.model_cache:
+            cls.model_cache.invalidate(cls, route_params)
+
+    def load_model(self) -> dict | None:
+        return None
+
     def update_model_partial(self, changes: dict) -> bool:
-        model_map = self.current_model.dict()
-        for k, v in model_map:
-            if changes[k] != v:
-                model_map[k] = changes[k]
-        return self.update_model_complete(model_map)
+        if not self._can_validate_fields(changes):
+            return self.update_model_complete(self._merge_changes(changes))
+
+        model, valid = self._validate_fields(changes)
+        # only fields that were passed can have changed
+        self._replace_model(model, changes.keys())
+        return valid
 
     def update_model_complete(self, new_model: dict) -> bool:
-        try:
-            self.current_model = self.model_class(**new_model)
-            return True
+        model, valid = self._validate_model(new_model)
+        self._replace_model(model)
+        return valid
+
+    def _validate_fields(self, changes: dict) -> tuple[BaseModel, bool]:
+        # unchanged fields are already validated and simply copied
+        values = dict(self.current_model.__dict__)
+        fields = self.model_class.__fields__
+        valid = True
+        for name, value in changes.items():
+            validated_value, errors = fields[name].validate(
+                value, values, loc=name, cls=self.model_class
+            )
+            if errors:
+                valid = False
+                error = ValidationError([errors], self.model_class).errors()[-1]
+                validated_value = self._get_error_value(name, error["msg"], values)
+            values[name] = validated_value
+
+        fields_set = self.current_model.__fields_set__ | set(changes)
+        return self._create_model(values, fields_set), valid
 
-        except ValidationError as e:
-            modified_model = new_model
-            for error in e.errors():
-                location = str(error["loc"][0])
-                modified_model[location] = ErrorMessage(message=error["msg"])
+    def _validate_model(self, new_model: dict) -> tuple[BaseModel, bool]:
+        values, fields_set, validation_error = validate_model(
+            self.model_class, new_model
+        )
+        if validation_error:
+            # pydantic reports errors of aliased fields by their alias
+            field_names = {
+                field.alias: name for name, field in self.model_class.__fields__.items()
+            }
+            for error in validation_error.errors():
+                name = field_names.get(str(error["loc"][0]))
+                if name is None:
+                    # e.g. errors of root validators that can't be assigned to a field
+                    raise validation_error
+                values[name] = self._get_error_value(name, error["msg"], values)
+        return self._create_model(values, fields_set), validation_error is None
 
-            self.current_model = self.model_class(**modified_model)
+    def _can_validate_fields(self, changes: dict) -> bool:
+        # root validators need the whole model, so does anything pydantic would ignore
+        if (
+            self.model_class.__pre_root_validators__
+            or self.model_class.__post_root_validators__
+        ):
             return False
+        fields = self.model_class.__fields__
+        return all(name in fields and fields[name].alias == name for name in changes)
+
+    def _merge_changes(self, changes: dict) -> dict:
+        # validate_model() reads aliased fields by their alias
+        model_map = self.current_model.dict(by_alias=True)
+        model_map.update(changes)
+        return model_map
+
+    def _create_model(self, values: dict, fields_set: set[str]) -> BaseModel:
+        # values are validated and complete, which is what BaseModel.__init__ does
+        # after validating them itself (construct() would go over every field again)
+        model = self.model_class.__new__(self.model_class)
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__fields_set__", fields_set)
+        model._init_private_attributes()
+        return model
+
+    def _get_error_value(self, name: str, message: str, values: dict) -> ErrorMessage:
+        field = self.model_class.__fields__[name]
+        error_value, errors = field.validate(
+            ErrorMessage(message=message), values, loc=name, cls=self.model_class
+        )
+        if errors:
+            # the field can't hold an ErrorMessage
+            raise ValidationError([errors], self.model_class)
+        return error_value
+
+    def _load_initial_model(self) -> None:
+        if self.model_cache is None:
+            model = self._build_loaded_model(self.load_model())
+        else:
+            model = self.model_cache.get_or_load(
+                type(self),
+                self.route_params,
+                lambda: self._build_loaded_model(self.load_model()),
+            )
+        if model is not None:
+            self.current_model = model
+
+    def _build_loaded_model(self, changes: dict | None) -> BaseModel | None:
+        if changes is None:
+            return None
+        # validated like update_model_partial(), invalid fields hold an ErrorMessage
+        if self._can_validate_fields(changes):
+            return self._validate_fields(changes)[0]
+        return self._validate_model(self._merge_changes(changes))[0]
+
+    def _replace_model(
+        self, model: BaseModel, field_names: Iterable[str] | None = None
+    ) -> None:
+        previous_model = self.current_model
+        self.current_model = model
+        changed_fields = self._get_changed_fields(previous_model, field_names)
+        if changed_fields:
+            self.notify_observers(changed_fields)
 
-        finally:
-            self.notify_observers()
+    def _get_changed_fields(
+        self, previous_model: BaseModel, field_names: Iterable[str] | None = None
+    ) -> set[str]:
+        return {
+            field_name
+            for field_name in field_names or self.current_model.__fields__
+            if getattr(self.current_model, field_name)
+            != getattr(previous_model, field_name)
+        }
@@ -6,6 +6,8 @@ import flet as ft
 from abstractcp import Abstract, abstract_class_property
 from pydantic import BaseModel
 
+from fletched import instrumentation
+from fletched.mvp.batch import current_batch
 from fletched.mvp.protocols import MvpPresenterProtocol
 from fletched.mvp.renderer import MvpRenderer
 
@@ -38,6 +40,8 @@ class MvpDialog(Abstract, ft.UserControl):
     def build(self) -> ft.AlertDialog:
         self.dialog.content = self.get_content()
         self.dialog.actions = self.get_actions()
+        # flet builds the dialog again whenever it is added to the page
+        self._renderer.invalidate()
         return self.dialog
 
     @abstractmethod
@@ -48,7 +52,16 @@ class MvpDialog(Abstract, ft.UserControl):
     def get_actions(self) -> list[ft.Control] | None:
         ...
 
-    def render(self, model: BaseModel) -> None:
-        self._renderer.render(model)
-        if self.page:
-            self.update()
+    def render(self, model: BaseModel, changed_fields: set[str] | None = None) -> None:
+        tags = {"view": type(self).__name__}
+        with instrumentation.timed("render", **tags):
+            rendered = self._renderer.render(model, changed_fields)
+        instrumentation.count("controls_rendered", rendered, **tags)
+        if not rendered or not self.page:
+            return
+        batch = current_batch()
+        if batch:
+            batch.add_page(self.page)
+        else:
+            with instrumentation.timed("page_update", **tags):
+                self.update()
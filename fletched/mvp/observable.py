@@ -1,4 +1,8 @@
-from typing import Callable
+import inspect
+from functools import wraps
+from typing import Callable, ContextManager
+
+from fletched.mvp.batch import UpdateBatch, batch_updates, current_batch
 
 
 class Observable:
@@ -6,8 +10,40 @@ class Observable:
         self.observers: list[Callable] = []
 
     def register(self, fn: Callable) -> None:
+        if not _accepts_changed_fields(fn):
+            # observers from before change sets were passed take no arguments
+            fn = _ignore_changed_fields(fn)
         self.observers.append(fn)
 
-    def notify_observers(self) -> None:
+    def notify_observers(self, changed_fields: set[str] | None = None) -> None:
+        batch = current_batch()
+        if batch:
+            batch.add_changes(self, changed_fields)
+            return
+        self._notify(changed_fields)
+
+    def batch(self) -> ContextManager[UpdateBatch]:
+        return batch_updates()
+
+    def _notify(self, changed_fields: set[str] | None) -> None:
         for fn in self.observers:
-            fn()
+            fn(changed_fields)
+
+
+def _accepts_changed_fields(fn: Callable) -> bool:
+    try:
+        inspect.signature(fn).bind(None)
+    except TypeError:
+        return False
+    except ValueError:
+        # no signature to inspect, e.g. of some builtins
+        pass
+    return True
+
+
+def _ignore_changed_fields(fn: Callable) -> Callable:
+    @wraps(fn)
+    def observer(changed_fields: set[str] | None) -> None:
+        fn()
+
+    return observer
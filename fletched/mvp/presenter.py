@@ -17,5 +17,5 @@ class MvpPresenter:
     def build(self) -> None:
         self.view.build(self)
 
-    def update_view(self) -> None:
-        self.view.render(self.data_source.current_model)
+    def update_view(self, changed_fields: set[str] | None = None) -> None:
+        self.view.render(self.data_source.current_model, changed_fields)
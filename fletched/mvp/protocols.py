@@ -4,7 +4,7 @@ from pydantic import BaseModel
 
 
 class MvpPresenterProtocol(Protocol):
-    def update_view(self) -> None:
+    def update_view(self, changed_fields: set[str] | None = None) -> None:
         ...
 
     def build(self) -> None:
@@ -12,7 +12,7 @@ class MvpPresenterProtocol(Protocol):
 
 
 class MvpViewProtocol(Protocol):
-    def render(self, model: BaseModel) -> None:
+    def render(self, model: BaseModel, changed_fields: set[str] | None = None) -> None:
         ...
 
     def build(self, presenter: MvpPresenterProtocol) -> None:
@@ -7,22 +7,58 @@ from fletched.mvp.error import ErrorMessage
 class MvpRenderer:
     def __init__(self, ref_map: dict[str, ft.Ref]) -> None:
         self.ref_map = ref_map
+        self._bindings: list[tuple[str, ft.Control, str]] | None = None
+        # only errors the renderer has set are cleared, not those of user code
+        self._error_fields: set[str] = set()
 
-    def render(self, model: BaseModel) -> None:
-        model_map = model.dict()
+    def render(self, model: BaseModel, changed_fields: set[str] | None = None) -> int:
+        bindings = self._bindings or self._compile_bindings()
+        rendered = 0
 
-        for variable_name, ref in self.ref_map.items():
+        for variable_name, control, control_attribute_name in bindings:
+            if changed_fields is not None and variable_name not in changed_fields:
+                continue
 
-            model_field_content = model_map[variable_name]
-            control_attribute_name = "value"
-            if not hasattr(ref.current, control_attribute_name):
-                control_attribute_name = "text"
+            model_field_content = getattr(model, variable_name)
             if isinstance(model_field_content, ErrorMessage):
                 control_attribute_name = "error_text"
                 model_field_content = model_field_content.message
+                self._error_fields.add(variable_name)
+            elif variable_name in self._error_fields:
+                # the field is valid again, its previous error is outdated
+                self._error_fields.discard(variable_name)
+                control.error_text = None
+                rendered += 1
 
-            control_attribute_content = getattr(ref.current, control_attribute_name)
+            control_attribute_content = getattr(control, control_attribute_name)
 
             if model_field_content == control_attribute_content:
                 continue
-            setattr(ref.current, control_attribute_name, model_field_content)
+            setattr(control, control_attribute_name, model_field_content)
+            rendered += 1
+
+        return rendered
+
+    def restore_refs(self) -> None:
+        # refs are class attributes, so every view of the same class that was built
+        # later has connected them to its own controls
+        for variable_name, control, _ in self._bindings or []:
+            self.ref_map[variable_name].current = control
+
+    def invalidate(self) -> None:
+        # the controls were rebuilt, the bindings point at detached ones
+        self._bindings = None
+        self._error_fields = set()
+
+    def _compile_bindings(self) -> list[tuple[str, ft.Control, str]]:
+        bindings = []
+        for variable_name, ref in self.ref_map.items():
+            control_attribute_name = "value"
+            if not hasattr(ref.current, control_attribute_name):
+                control_attribute_name = "text"
+            bindings.append((variable_name, ref.current, control_attribute_name))
+
+        # refs are only connected to their controls once the view is built
+        if all(ref.current is not None for ref in self.ref_map.values()):
+            self._bindings = bindings
+        return bindings
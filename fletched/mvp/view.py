@@ -1,4 +1,9 @@
+import logging
+import threading
+import time
 from abc import abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import asdict, dataclass
 from typing import List, Optional, Type
 
@@ -6,11 +11,18 @@ import flet as ft
 from abstractcp import Abstract, abstract_class_property
 from pydantic import BaseModel
 
+from fletched import instrumentation
+from fletched.mvp.async_datasource import AsyncMvpDataSource
+from fletched.mvp.batch import current_batch
 from fletched.mvp.datasource import MvpDataSource
 from fletched.mvp.presenter import MvpPresenter
 from fletched.mvp.protocols import MvpPresenterProtocol
 from fletched.mvp.renderer import MvpRenderer
-from fletched.routed_app import PageNotFoundView, ViewBuilder
+from fletched.routed_app.page_not_found import PageNotFoundView
+from fletched.routed_app.prefetch import get_prefetch_executor
+from fletched.routed_app.view_builder import ViewBuilder
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -36,11 +48,25 @@ class MvpView(Abstract, ft.View):
     def __init__(self) -> None:
         super().__init__(**asdict(self.config))
         self._renderer = MvpRenderer(self.ref_map)
-
-    def render(self, model: BaseModel) -> None:
-        self._renderer.render(model)
-        if self.page:
-            self.page.update()
+        # only set for cached views, see MvpViewBuilder.refresh_view
+        self._presenter: MvpPresenter | None = None
+
+    def render(self, model: BaseModel, changed_fields: set[str] | None = None) -> None:
+        tags = {"route": str(self.route), "view": type(self).__name__}
+        with instrumentation.timed("render", **tags):
+            rendered = self._renderer.render(model, changed_fields)
+        instrumentation.count("controls_rendered", rendered, **tags)
+        if not rendered or not self.page:
+            return
+        batch = current_batch()
+        if batch:
+            batch.add_page(self.page)
+        else:
+            with instrumentation.timed("page_update", **tags):
+                self.page.update()
+
+    def restore_refs(self) -> None:
+        self._renderer.restore_refs()
 
     @abstractmethod
     def build(self, presenter: MvpPresenterProtocol) -> None:
@@ -51,6 +77,18 @@ class MvpViewBuilder(Abstract, ViewBuilder):
     data_source_class = abstract_class_property(Type[MvpDataSource])
     view_class = abstract_class_property(Type[MvpView])
     presenter_class = abstract_class_property(Type[MvpPresenter])
+    prefetch_cache_size: int = 8
+    prefetch_ttl: float | None = 30
+
+    def __init__(
+        self, *, page: ft.Page, route: str | None = None, unauthorized_return_route: str
+    ) -> None:
+        super().__init__(
+            page=page, route=route, unauthorized_return_route=unauthorized_return_route
+        )
+        self._prefetched: OrderedDict[tuple, tuple[Future, float]] = OrderedDict()
+        # prefetch() is called by hover handlers, which run on flet's thread pool
+        self._prefetch_lock = threading.Lock()
 
     def build_view(self, route_params: dict[str, str]) -> ft.View:
 
@@ -58,9 +96,7 @@ class MvpViewBuilder(Abstract, ViewBuilder):
             not hasattr(self, "data_source")
             or route_params != self.data_source.route_params
         ):
-            self.data_source = self.data_source_class(
-                app=self.app, route_params=route_params
-            )
+            self.data_source = self._get_data_source(route_params)
 
         if self.data_source.route_params and not self.data_source.route_params_valid:
             return PageNotFoundView()
@@ -73,5 +109,92 @@ class MvpViewBuilder(Abstract, ViewBuilder):
         )
         self.presenter.build()
         self.view.render(self.data_source.current_model)
+        self._load_data_source()
+        if self.cache_view and getattr(self.app, "view_cache", None) is not None:
+            # the presenter lives as long as the cached view, not the ViewBuilder
+            self.view._presenter = self.presenter  # type: ignore
 
         return self.view
+
+    def refresh_view(self, view: ft.View, route_params: dict[str, str]) -> None:
+        presenter = getattr(view, "_presenter", None)
+        if not presenter:
+            return
+        self.data_source = presenter.data_source
+        self.view = view
+        self.presenter = presenter
+        # the refs of the view class point to the controls of the view built last
+        if isinstance(view, MvpView):
+            view.restore_refs()
+        # the renderer only touches controls whose model field changed
+        self.view.render(self.data_source.current_model)
+        self._load_data_source()
+
+    def prefetch(self, route_params: dict[str, str]) -> Future | None:
+        if (
+            hasattr(self, "data_source")
+            and route_params == self.data_source.route_params
+        ):
+            return None
+        key = tuple(sorted(route_params.items()))
+        with self._prefetch_lock:
+            entry = self._pop_prefetched(key)
+            if entry is not None:
+                # keeps its age, but becomes the most recently used one
+                self._prefetched[key] = entry
+                return entry[0]
+
+            future = get_prefetch_executor().submit(
+                self._prefetch_data_source, route_params
+            )
+            self._prefetched[key] = (future, time.monotonic())
+            while len(self._prefetched) > self.prefetch_cache_size:
+                _, (evicted_future, _) = self._prefetched.popitem(last=False)
+                evicted_future.cancel()
+        return future
+
+    def leave_view(self) -> None:
+        data_source = getattr(self, "data_source", None)
+        if isinstance(data_source, AsyncMvpDataSource):
+            data_source.cancel()
+
+    def _pop_prefetched(self, key: tuple) -> tuple[Future, float] | None:
+        # only called with the prefetch lock held
+        entry = self._prefetched.pop(key, None)
+        if entry is None:
+            return None
+        future, prefetched_at = entry
+        if (
+            self.prefetch_ttl is not None
+            and time.monotonic() - prefetched_at > self.prefetch_ttl
+        ):
+            # the data may have changed since
+            future.cancel()
+            return None
+        return entry
+
+    def _get_data_source(self, route_params: dict[str, str]) -> MvpDataSource:
+        with self._prefetch_lock:
+            entry = self._pop_prefetched(tuple(sorted(route_params.items())))
+        future = entry[0] if entry else None
+        if future is not None and not future.cancelled():
+            try:
+                # waiting for a prefetch that is still running beats starting over
+                return future.result()
+            except Exception:
+                logger.exception(
+                    "prefetching %s failed, creating it again",
+                    self.data_source_class.__name__,
+                )
+        return self.data_source_class(app=self.app, route_params=route_params)
+
+    def _prefetch_data_source(self, route_params: dict[str, str]) -> MvpDataSource:
+        data_source = self.data_source_class(app=self.app, route_params=route_params)
+        if isinstance(data_source, AsyncMvpDataSource):
+            data_source.load()
+        return data_source
+
+    def _load_data_source(self) -> None:
+        # async data sources are rendered with their initial model until loaded
+        if isinstance(self.data_source, AsyncMvpDataSource):
+            self.data_source.load()
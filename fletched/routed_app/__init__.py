@@ -1,6 +1,33 @@
-from fletched.routed_app.app import RoutedApp
-from fletched.routed_app.auth import group_required, login_required
-from fletched.routed_app.page_not_found import PageNotFoundView
-from fletched.routed_app.routing import route
-from fletched.routed_app.state import CustomAppState
-from fletched.routed_app.view_builder import ViewBuilder
+from typing import TYPE_CHECKING
+
+from fletched.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from fletched.routed_app.app import RoutedApp
+    from fletched.routed_app.auth import group_required, login_required
+    from fletched.routed_app.page_not_found import PageNotFoundView
+    from fletched.routed_app.routing import route
+    from fletched.routed_app.state import CustomAppState
+    from fletched.routed_app.view_builder import ViewBuilder
+
+__all__ = [
+    "CustomAppState",
+    "PageNotFoundView",
+    "RoutedApp",
+    "ViewBuilder",
+    "group_required",
+    "login_required",
+    "route",
+]
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "RoutedApp": "fletched.routed_app.app",
+        "group_required": "fletched.routed_app.auth",
+        "login_required": "fletched.routed_app.auth",
+        "PageNotFoundView": "fletched.routed_app.page_not_found",
+        "route": "fletched.routed_app.routing",
+        "CustomAppState": "fletched.routed_app.state",
+        "ViewBuilder": "fletched.routed_app.view_builder",
+    },
+)
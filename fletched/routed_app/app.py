@@ -1,16 +1,39 @@
-import re
+import threading
+import warnings
 from collections import defaultdict
+from concurrent.futures import Future
 from typing import Type
 
 import flet as ft
-import repath
 
+from fletched import instrumentation
 from fletched.routed_app.page_not_found import PageNotFoundView
+from fletched.routed_app.route_table import RouteTable, get_route_table
 from fletched.routed_app.state import CustomAppState
 from fletched.routed_app.view_builder import ViewBuilder
+from fletched.routed_app.view_cache import ViewCache
+
+
+def _not_set() -> str:
+    return "not set"
 
 
 class RoutedApp:
+    # one instance per session, so every attribute counts
+    __slots__ = (
+        "page",
+        "unauthorized_return_route",
+        "last_unauthorized_route",
+        "route_cache_size",
+        "route_table",
+        "current_view_builder",
+        "current_route_params",
+        "view_cache",
+        "state",
+        "_view_builder_classes",
+        "_view_builders",
+        "_view_builders_lock",
+    )
     state: defaultdict | CustomAppState
 
     def __init__(
@@ -18,33 +41,95 @@ class RoutedApp:
         page: ft.Page,
         unauthorized_return_route: str = "/login",
         custom_state: bool = False,
+        route_cache_size: int = 256,
+        view_cache_size: int = 0,
+        view_cache_ttl: float | None = None,
     ) -> None:
         self.page = page
         self.unauthorized_return_route: str = unauthorized_return_route
         self.last_unauthorized_route: str | None = None
-        self.route_pattern_to_viewbuilder: dict[str, ViewBuilder] = {}
+        self.route_cache_size = route_cache_size
+        self.route_table: RouteTable = get_route_table((), route_cache_size)
+        self._view_builder_classes: tuple[Type[ViewBuilder], ...] = ()
+        self._view_builders: dict[Type[ViewBuilder], ViewBuilder] = {}
+        self._view_builders_lock = threading.Lock()
+        self.current_view_builder: ViewBuilder | None = None
+        self.current_route_params: dict[str, str] = {}
+        self.view_cache: ViewCache | None = None
+        if view_cache_size:
+            self.view_cache = ViewCache(size=view_cache_size, ttl=view_cache_ttl)
 
         if not custom_state:
-            self.state = defaultdict(lambda: "not set")
+            self.state = defaultdict(_not_set)
 
         self.page.on_route_change = self._append_view
         self.page.on_view_pop = self._pop_view
 
+    @property
+    def route_pattern_to_viewbuilder(self) -> dict[str, ViewBuilder]:
+        warnings.warn(
+            "route_pattern_to_viewbuilder creates every ViewBuilder, "
+            "use route_table.patterns to get the ViewBuilder class of each route",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return {
+            pattern: self._get_view_builder(view_builder_class)
+            for pattern, view_builder_class in self.route_table.patterns.items()
+        }
+
     def add_view_builders(self, view_builder_classes: list[Type[ViewBuilder]]) -> None:
-        for view_builder_class in view_builder_classes:
-            view_builder = view_builder_class(
-                page=self.page, unauthorized_return_route=self.unauthorized_return_route
-            )
-            view_builder._set_app(self)
-            if view_builder.route:
-                route_pattern = repath.pattern(view_builder.route)
-                self.route_pattern_to_viewbuilder[route_pattern] = view_builder
+        # ViewBuilders are only created once their route is first visited
+        self._view_builder_classes += tuple(view_builder_classes)
+        self.route_table = get_route_table(
+            self._view_builder_classes, self.route_cache_size
+        )
+
+    def _get_view_builder(self, view_builder_class: Type[ViewBuilder]) -> ViewBuilder:
+        view_builder = self._view_builders.get(view_builder_class)
+        if view_builder is not None:
+            return view_builder
+        # prefetch() may run on flet's thread pool while navigating, a second
+        # ViewBuilder would drop the prefetched data sources of the first
+        with self._view_builders_lock:
+            view_builder = self._view_builders.get(view_builder_class)
+            if view_builder is None:
+                view_builder = view_builder_class(
+                    page=self.page,
+                    unauthorized_return_route=self.unauthorized_return_route,
+                )
+                view_builder._set_app(self)
+                self._view_builders[view_builder_class] = view_builder
+        return view_builder
 
     def _append_view(self, e: ft.RouteChangeEvent) -> None:
         self.page.views.clear()
+        if self.current_view_builder:
+            self.current_view_builder.leave_view()
         view = self._get_view(e.route)
         self.page.views.append(view)
-        self.page.update()
+        route = self.current_view_builder.route if self.current_view_builder else None
+        with instrumentation.timed("page_update", route=str(route)):
+            self.page.update()
+        if self.current_view_builder:
+            prefetch_routes = self.current_view_builder.prefetch_routes(
+                self.current_route_params
+            )
+            for route in prefetch_routes:
+                self.prefetch(route)
+
+    def prefetch(self, route: str) -> Future | None:
+        with instrumentation.timed("route_match") as tags:
+            match = self.route_table.match(route)
+            if match:
+                tags["route"] = str(match[0].route)
+        if not match:
+            return None
+        view_builder_class, route_params = match
+        view_builder = self._get_view_builder(view_builder_class)
+        if not view_builder.authorized:
+            return None
+        return view_builder.prefetch(route_params)
 
     def _pop_view(self, e: ft.ViewPopEvent) -> None:
         if len(self.page.views) == 1:
@@ -54,9 +139,38 @@ class RoutedApp:
         self.page.go(top_view.route)
 
     def _get_view(self, route: str) -> ft.View:
-        for route_pattern, view_builder in self.route_pattern_to_viewbuilder.items():
-            match = re.match(route_pattern, route)
+        with instrumentation.timed("route_match") as tags:
+            match = self.route_table.match(route)
             if match:
-                route_params = match.groupdict()
-                return view_builder.view_func(route_params)
-        return PageNotFoundView()
+                tags["route"] = str(match[0].route)
+        if not match:
+            self.current_view_builder = None
+            return PageNotFoundView()
+        view_builder_class, route_params = match
+        view_builder = self._get_view_builder(view_builder_class)
+        self.current_view_builder = view_builder
+        self.current_route_params = route_params
+        # auth_func is only called once per navigation
+        authorized = view_builder.authorized
+        if self.view_cache is None or not view_builder.cache_view or not authorized:
+            return self._build_view(view_builder, route_params, authorized)
+
+        view = self.view_cache.get(route)
+        if view is not None:
+            with instrumentation.timed(
+                "refresh_view", route=str(view_builder.route), view=type(view).__name__
+            ):
+                view_builder.refresh_view(view, route_params)
+            return view
+        view = self._build_view(view_builder, route_params, authorized)
+        if not isinstance(view, PageNotFoundView):
+            self.view_cache.put(route, view)
+        return view
+
+    def _build_view(
+        self, view_builder: ViewBuilder, route_params: dict[str, str], authorized: bool
+    ) -> ft.View:
+        with instrumentation.timed("build_view", route=str(view_builder.route)) as tags:
+            view = view_builder._get_view_func(authorized)(route_params)
+            tags["view"] = type(view).__name__
+        return view
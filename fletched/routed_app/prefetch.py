@@ -0,0 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from fletched.executors import get_executor
+
+PREFETCH_WORKERS = 4
+
+
+def get_prefetch_executor() -> ThreadPoolExecutor:
+    return get_executor("prefetch", PREFETCH_WORKERS)
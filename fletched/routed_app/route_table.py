@@ -0,0 +1,192 @@
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Type
+
+import repath
+
+from fletched.routed_app.view_builder import ViewBuilder
+
+RouteMatch = tuple[Type[ViewBuilder], dict[str, str]]
+
+
+@lru_cache(maxsize=None)
+def compile_route(route: str) -> tuple[str, re.Pattern, tuple]:
+    # routes are compiled once per process, no matter how many sessions add them
+    pattern = repath.pattern(route)
+    return pattern, re.compile(pattern), tuple(repath.parse(route))
+
+
+@lru_cache(maxsize=32)
+def get_route_table(
+    view_builder_classes: tuple[Type[ViewBuilder], ...], cache_size: int = 256
+) -> "RouteTable":
+    # sessions adding the same ViewBuilder classes share one table
+    route_table = RouteTable(cache_size=cache_size)
+    for view_builder_class in view_builder_classes:
+        if view_builder_class.route:
+            route_table.add(view_builder_class.route, view_builder_class)
+    return route_table
+
+
+@dataclass(slots=True)
+class CompiledRoute:
+    route: str
+    pattern: str
+    regex: re.Pattern
+    view_builder_class: Type[ViewBuilder]
+    wildcard_count: int
+    parameter_count: int
+    static_length: int
+    first_segment: str | None
+    order: int
+
+    @property
+    def specificity(self) -> tuple[int, int, int, int]:
+        # optional and repeating parameters match the most paths, so they rank last
+        return (
+            self.wildcard_count,
+            self.parameter_count,
+            -self.static_length,
+            self.order,
+        )
+
+
+class RouteTable:
+    __slots__ = (
+        "cache_size",
+        "patterns",
+        "_static_routes",
+        "_dynamic_routes",
+        "_segment_routes",
+        "_wildcard_routes",
+        "_cache",
+        "_lock",
+    )
+
+    def __init__(self, cache_size: int = 256) -> None:
+        self.cache_size = cache_size
+        self.patterns: dict[str, Type[ViewBuilder]] = {}
+        self._static_routes: dict[str, Type[ViewBuilder]] = {}
+        self._dynamic_routes: list[CompiledRoute] = []
+        self._segment_routes: dict[str, list[CompiledRoute]] = {}
+        self._wildcard_routes: list[CompiledRoute] = []
+        self._cache: OrderedDict[str, RouteMatch | None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, route: str, view_builder_class: Type[ViewBuilder]) -> str:
+        pattern, regex, tokens = compile_route(route)
+        previous_class = self.patterns.get(pattern)
+        self.patterns[pattern] = view_builder_class
+        with self._lock:
+            self._cache.clear()
+
+        static = all(isinstance(token, str) for token in tokens)
+        if previous_class is not None:
+            # a route that is declared again is served by the last ViewBuilder
+            self._replace(route, regex, static, previous_class, view_builder_class)
+            return pattern
+
+        if static:
+            # static routes only ever match themselves (with or without a slash)
+            for candidate in {route, route + "/", route.rstrip("/")}:
+                if regex.match(candidate):
+                    self._static_routes.setdefault(candidate, view_builder_class)
+            return pattern
+
+        compiled_route = CompiledRoute(
+            route=route,
+            pattern=pattern,
+            regex=regex,
+            view_builder_class=view_builder_class,
+            wildcard_count=sum(
+                isinstance(token, dict) and (token["repeat"] or token["optional"])
+                for token in tokens
+            ),
+            parameter_count=sum(isinstance(token, dict) for token in tokens),
+            static_length=sum(len(token) for token in tokens if isinstance(token, str)),
+            first_segment=self._get_first_segment(tokens),
+            order=len(self._dynamic_routes),
+        )
+        self._dynamic_routes.append(compiled_route)
+        self._dynamic_routes.sort(key=lambda compiled: compiled.specificity)
+        self._wildcard_routes = [
+            compiled for compiled in self._dynamic_routes if not compiled.first_segment
+        ]
+        segments = {compiled.first_segment for compiled in self._dynamic_routes}
+        self._segment_routes = {
+            segment: [
+                compiled
+                for compiled in self._dynamic_routes
+                if compiled.first_segment in (segment, None)
+            ]
+            for segment in segments
+            if segment
+        }
+        return pattern
+
+    def _replace(
+        self,
+        route: str,
+        regex: re.Pattern,
+        static: bool,
+        previous_class: Type[ViewBuilder],
+        view_builder_class: Type[ViewBuilder],
+    ) -> None:
+        if static:
+            for candidate in {route, route + "/", route.rstrip("/")}:
+                if (
+                    regex.match(candidate)
+                    and self._static_routes.get(candidate) is previous_class
+                ):
+                    self._static_routes[candidate] = view_builder_class
+            return
+        for compiled_route in self._dynamic_routes:
+            if compiled_route.pattern == regex.pattern:
+                compiled_route.view_builder_class = view_builder_class
+
+    def match(self, route: str) -> RouteMatch | None:
+        with self._lock:
+            cached = route in self._cache
+            if cached:
+                self._cache.move_to_end(route)
+                result = self._cache[route]
+        if not cached:
+            result = self._match(route)
+            with self._lock:
+                self._cache[route] = result
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        if result is None:
+            return None
+        view_builder_class, route_params = result
+        return view_builder_class, dict(route_params)
+
+    def _match(self, route: str) -> RouteMatch | None:
+        view_builder_class = self._static_routes.get(route)
+        if view_builder_class:
+            return view_builder_class, {}
+
+        segment = route.split("/", 2)[1] if route.startswith("/") else ""
+        for compiled_route in self._segment_routes.get(segment, self._wildcard_routes):
+            match = compiled_route.regex.match(route)
+            if match:
+                return compiled_route.view_builder_class, match.groupdict()
+        return None
+
+    @staticmethod
+    def _get_first_segment(tokens: tuple) -> str | None:
+        prefix = tokens[0]
+        if not isinstance(prefix, str) or not prefix.startswith("/"):
+            return None
+        segments = prefix.split("/")
+        next_token = tokens[1] if len(tokens) > 1 else None
+        # the first segment is only complete if something delimits it
+        if len(segments) > 2 or (
+            isinstance(next_token, dict) and next_token["prefix"] == "/"
+        ):
+            return segments[1]
+        return None
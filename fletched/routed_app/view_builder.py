@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from typing import Any, Callable
 
 import flet as ft
 
+from fletched import instrumentation
+
 
 class ViewBuilder(ABC):
     route: str | None = None
     auth_func: Callable[..., bool] | None = None
+    cache_view: bool = True
 
     def __init__(
         self, *, page: ft.Page, route: str | None = None, unauthorized_return_route: str
@@ -16,14 +20,19 @@ class ViewBuilder(ABC):
         self.unauthorized_return_route = unauthorized_return_route
         if route:
             self.route: str | None = route
-        self.__view_func: Callable[..., ft.View] = self.build_view
+        # a bound build_view would be a reference cycle, which only the gc can free
+        self.__view_func: Callable[..., ft.View] | None = None
+
+    @property
+    def authorized(self) -> bool:
+        if not self.auth_func:
+            return True
+        with instrumentation.timed("auth", route=str(self.route)):
+            return self.auth_func()
 
     @property
     def view_func(self) -> Callable[..., ft.View]:
-        if self.auth_func and not self.auth_func():
-            self.app.last_unauthorized_route = self.route
-            return self._build_unauthorized_view
-        return self.__view_func
+        return self._get_view_func(self.authorized)
 
     @view_func.setter
     def view_func(self, func: Callable) -> None:
@@ -33,10 +42,30 @@ class ViewBuilder(ABC):
     def build_view(self, route_params: dict[str, str]) -> ft.View:
         ...
 
+    def refresh_view(self, view: ft.View, route_params: dict[str, str]) -> None:
+        pass
+
+    def leave_view(self) -> None:
+        pass
+
+    def prefetch(self, route_params: dict[str, str]) -> Future | None:
+        return None
+
+    def prefetch_routes(self, route_params: dict[str, str]) -> list[str]:
+        return []
+
+    def _get_view_func(self, authorized: bool) -> Callable[..., ft.View]:
+        if not authorized:
+            self.app.last_unauthorized_route = self.route
+            return self._build_unauthorized_view
+        return self.__view_func or self.build_view
+
     def _set_app(self, app) -> None:
         self.app: Any = app
 
-    def _build_unauthorized_view(self) -> ft.View:
+    def _build_unauthorized_view(
+        self, route_params: dict[str, str] | None = None
+    ) -> ft.View:
         return ft.View(
             controls=[
                 ft.TextButton(
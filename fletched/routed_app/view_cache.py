@@ -0,0 +1,36 @@
+import time
+from collections import OrderedDict
+
+import flet as ft
+
+
+class ViewCache:
+    __slots__ = ("size", "ttl", "_views")
+
+    def __init__(self, size: int, ttl: float | None = None) -> None:
+        self.size = size
+        self.ttl = ttl
+        self._views: OrderedDict[str, tuple[ft.View, float]] = OrderedDict()
+
+    def get(self, route: str) -> ft.View | None:
+        entry = self._views.get(route)
+        if entry is None:
+            return None
+        view, created_at = entry
+        if self.ttl is not None and time.monotonic() - created_at > self.ttl:
+            del self._views[route]
+            return None
+        self._views.move_to_end(route)
+        return view
+
+    def put(self, route: str, view: ft.View) -> None:
+        self._views[route] = (view, time.monotonic())
+        self._views.move_to_end(route)
+        while len(self._views) > self.size:
+            self._views.popitem(last=False)
+
+    def invalidate(self, route: str | None = None) -> None:
+        if route is None:
+            self._views.clear()
+        else:
+            self._views.pop(route, None)
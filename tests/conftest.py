@@ -0,0 +1,150 @@
+from dataclasses import dataclass
+from typing import Callable
+
+import flet as ft
+import pytest
+from pydantic import validator
+
+from benchmarks.fake_page import FakePage
+from fletched.mvp import (
+    ErrorMessage,
+    MvpDataSource,
+    MvpModel,
+    MvpPresenter,
+    MvpView,
+    MvpViewBuilder,
+    ViewConfig,
+)
+from fletched.routed_app import route
+
+
+class CounterModel(MvpModel):
+    count: int = 0
+    name: str = ""
+
+
+class CounterDataSource(MvpDataSource):
+    current_model = CounterModel()
+
+
+class FormModel(MvpModel):
+    name: ErrorMessage | str = ""
+    age: ErrorMessage | int = 0
+    email: ErrorMessage | str = ""
+    action: str = ""
+
+    @validator("email")
+    def check_email(cls, value):
+        if isinstance(value, str) and value and "@" not in value:
+            raise ValueError("not an email address")
+        return value
+
+
+class FormDataSource(MvpDataSource):
+    current_model = FormModel()
+
+
+class ItemModel(MvpModel):
+    name: str = ""
+    age: int = 5
+
+
+class ItemDataSource(MvpDataSource):
+    current_model = ItemModel()
+    fail = False
+
+    @property
+    def route_params_valid(self) -> bool:
+        return True
+
+    def load_model(self) -> dict:
+        if ItemDataSource.fail:
+            raise RuntimeError("database is down")
+        return {"name": self.route_params["id"]}
+
+
+class ItemView(MvpView):
+    ref_map = {"age": ft.Ref[ft.TextField]()}
+    config = ViewConfig()
+
+    def build(self, presenter: MvpPresenter) -> None:
+        self.controls = [ft.TextField(ref=self.ref_map["age"])]
+
+
+@dataclass
+class ItemPresenter(MvpPresenter):
+    data_source: ItemDataSource
+    view: ItemView
+
+
+_auth_calls: list[bool] = []
+
+
+def _auth() -> bool:
+    _auth_calls.append(True)
+    return True
+
+
+@route("/item/:id")
+class ItemViewBuilder(MvpViewBuilder):
+    data_source_class = ItemDataSource
+    view_class = ItemView
+    presenter_class = ItemPresenter
+    auth_func = staticmethod(_auth)
+
+
+@pytest.fixture
+def page() -> FakePage:
+    return FakePage()
+
+
+@pytest.fixture
+def counter_model() -> CounterModel:
+    return CounterModel()
+
+
+@pytest.fixture
+def form_model() -> FormModel:
+    return FormModel()
+
+
+@pytest.fixture
+def get_data_source() -> Callable[..., tuple[MvpDataSource, list]]:
+    # the data source and the changed fields of every notification
+    def get(
+        data_source_class: type[MvpDataSource] = CounterDataSource,
+    ) -> tuple[MvpDataSource, list]:
+        data_source = data_source_class(app=None, route_params={})
+        notifications: list = []
+        data_source.register(notifications.append)
+        return data_source, notifications
+
+    return get
+
+
+@pytest.fixture
+def form_data_source(get_data_source) -> tuple[MvpDataSource, list]:
+    return get_data_source(FormDataSource)
+
+
+@pytest.fixture
+def item_view_builder_class() -> type[ItemViewBuilder]:
+    return ItemViewBuilder
+
+
+@pytest.fixture
+def get_view_builder(page) -> Callable[..., ItemViewBuilder]:
+    def get(**attributes) -> ItemViewBuilder:
+        view_builder = ItemViewBuilder(page=page, unauthorized_return_route="/login")
+        view_builder._set_app(None)
+        for name, value in attributes.items():
+            setattr(view_builder, name, value)
+        return view_builder
+
+    return get
+
+
+@pytest.fixture
+def auth_calls() -> list[bool]:
+    _auth_calls.clear()
+    return _auth_calls
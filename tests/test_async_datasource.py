@@ -0,0 +1,55 @@
+import logging
+
+from pydantic import root_validator
+
+from fletched.mvp import AsyncMvpDataSource, ErrorMessage, MvpModel
+
+
+class UserModel(MvpModel):
+    name: str = ""
+    age: ErrorMessage | int = 0
+    loading: bool = True
+
+
+class UserDataSource(AsyncMvpDataSource):
+    current_model = UserModel()
+    loaded_fields: dict = {}
+
+    async def load_model_async(self) -> dict:
+        return {**self.loaded_fields, "loading": False}
+
+
+def load(data_source: AsyncMvpDataSource) -> None:
+    data_source.load()
+    data_source._load_task.result(timeout=5)  # type: ignore
+
+
+def test_loaded_fields_are_validated():
+    data_source = UserDataSource(app=None, route_params={})
+    data_source.loaded_fields = {"name": "Jane", "age": "old"}
+    load(data_source)
+
+    assert data_source.loaded
+    assert data_source.current_model.name == "Jane"
+    assert isinstance(data_source.current_model.age, ErrorMessage)
+    assert data_source.current_model.loading is False
+
+
+def test_load_failure_is_logged(caplog):
+    class StrictModel(UserModel):
+        @root_validator(skip_on_failure=True)
+        def check_name(cls, values: dict) -> dict:
+            if not values["name"]:
+                raise ValueError("name is missing")
+            return values
+
+    class StrictDataSource(UserDataSource):
+        current_model = StrictModel.construct()
+
+    data_source = StrictDataSource(app=None, route_params={})
+    with caplog.at_level(logging.ERROR):
+        load(data_source)
+
+    assert not data_source.loaded
+    assert not data_source.loading
+    assert "StrictDataSource" in caplog.text
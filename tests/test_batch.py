@@ -0,0 +1,75 @@
+import flet as ft
+
+from fletched.mvp import MvpPresenter, MvpView, ViewConfig, batch_updates
+
+
+class CounterView(MvpView):
+    ref_map = {"count": ft.Ref[ft.Text](), "name": ft.Ref[ft.TextField]()}
+    config = ViewConfig()
+
+    def build(self, presenter: MvpPresenter) -> None:
+        self.controls = [
+            ft.Text(ref=self.ref_map["count"]),
+            ft.TextField(ref=self.ref_map["name"]),
+        ]
+
+
+def test_batch_notifies_once_with_all_changed_fields(get_data_source):
+    data_source, notifications = get_data_source()
+    with data_source.batch():
+        data_source.update_model_partial({"count": 1})
+        data_source.update_model_partial({"name": "Jane"})
+        data_source.update_model_partial({"count": 2})
+        assert notifications == []
+    assert notifications == [{"count", "name"}]
+    assert data_source.current_model.count == 2
+
+
+def test_nested_batches_flush_with_the_outermost_one(get_data_source):
+    data_source, notifications = get_data_source()
+    other_data_source, other_notifications = get_data_source()
+    with batch_updates():
+        with data_source.batch():
+            data_source.update_model_partial({"count": 1})
+        assert notifications == []
+        other_data_source.update_model_partial({"name": "Jane"})
+    assert notifications == [{"count"}]
+    assert other_notifications == [{"name"}]
+
+
+def test_notifications_during_flush_are_merged(get_data_source):
+    data_source, notifications = get_data_source()
+    other_data_source, other_notifications = get_data_source()
+    # observers of the first data source update the other one
+    data_source.register(
+        lambda changed_fields: other_data_source.update_model_partial(
+            {"count": data_source.current_model.count}
+        )
+    )
+    with batch_updates():
+        data_source.update_model_partial({"count": 3})
+    assert notifications == [{"count"}]
+    assert other_notifications == [{"count"}]
+    assert other_data_source.current_model.count == 3
+
+
+def test_pages_are_updated_once(page):
+    with batch_updates() as batch:
+        batch.add_page(page)
+        batch.add_page(page)
+    assert page.update_count == 1
+
+
+def test_views_rendered_in_a_batch_update_the_page_once(page, counter_model):
+    view = CounterView()
+    view.build(None)  # type: ignore
+    view.page = page
+    with batch_updates():
+        view.render(counter_model.copy(update={"count": 1, "name": "Jane"}))
+        view.render(
+            counter_model.copy(update={"count": 2, "name": "Jane"}),
+            changed_fields={"count"},
+        )
+        assert page.update_count == 0
+    assert page.update_count == 1
+    assert view.ref_map["count"].current.value == 2
@@ -0,0 +1,101 @@
+import threading
+import time
+
+import pytest
+
+from fletched.mvp import ModelCache
+
+
+class DataSource:
+    pass
+
+
+class OtherDataSource:
+    pass
+
+
+def test_concurrent_loads_run_once():
+    cache = ModelCache()
+    calls = []
+    started = threading.Event()
+
+    def load() -> str:
+        calls.append(True)
+        started.set()
+        time.sleep(0.05)
+        return "model"
+
+    results = []
+
+    def get() -> None:
+        results.append(cache.get_or_load(DataSource, {"id": "1"}, load))
+
+    threads = [threading.Thread(target=get) for _ in range(5)]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == ["model"] * 5
+
+
+def test_models_are_cached_per_class_and_route_params():
+    cache = ModelCache()
+    assert cache.get_or_load(DataSource, {"id": "1"}, lambda: 1) == 1
+    assert cache.get_or_load(DataSource, {"id": "1"}, lambda: 2) == 1
+    assert cache.get_or_load(DataSource, {"id": "2"}, lambda: 3) == 3
+    assert cache.get_or_load(OtherDataSource, {"id": "1"}, lambda: 4) == 4
+
+
+def test_failed_loads_are_not_cached():
+    cache = ModelCache()
+
+    def fail() -> None:
+        raise RuntimeError("database is down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load(DataSource, {}, fail)
+    assert cache.get_or_load(DataSource, {}, lambda: 1) == 1
+
+
+def test_invalidation():
+    cache = ModelCache()
+    for route_id in ("1", "2"):
+        cache.get_or_load(DataSource, {"id": route_id}, lambda: "old")
+    cache.get_or_load(OtherDataSource, {"id": "1"}, lambda: "old")
+
+    cache.invalidate(DataSource, {"id": "1"})
+    assert cache.get_or_load(DataSource, {"id": "1"}, lambda: "new") == "new"
+    assert cache.get_or_load(DataSource, {"id": "2"}, lambda: "new") == "old"
+
+    cache.invalidate(DataSource)
+    assert cache.get_or_load(DataSource, {"id": "2"}, lambda: "new") == "new"
+    assert cache.get_or_load(OtherDataSource, {"id": "1"}, lambda: "new") == "old"
+
+    cache.invalidate()
+    assert cache.get_or_load(OtherDataSource, {"id": "1"}, lambda: "new") == "new"
+
+
+def test_invalidated_pending_load_is_not_cached():
+    cache = ModelCache()
+
+    def load() -> str:
+        # the data changes while it is being loaded
+        cache.invalidate(DataSource)
+        return "old"
+
+    assert cache.get_or_load(DataSource, {}, load) == "old"
+    assert cache.get_or_load(DataSource, {}, lambda: "new") == "new"
+
+
+def test_lru_and_ttl_eviction():
+    cache = ModelCache(max_size=2)
+    for route_id in ("1", "2", "3"):
+        cache.get_or_load(DataSource, {"id": route_id}, lambda: "old")
+    assert cache.get_or_load(DataSource, {"id": "1"}, lambda: "new") == "new"
+
+    cache = ModelCache(ttl=0)
+    cache.get_or_load(DataSource, {}, lambda: "old")
+    assert cache.get_or_load(DataSource, {}, lambda: "new") == "new"
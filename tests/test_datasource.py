@@ -0,0 +1,93 @@
+import pytest
+from pydantic import Field, ValidationError, root_validator
+
+from fletched.mvp import ErrorMessage, MvpDataSource, MvpModel
+
+
+class RangeModel(MvpModel):
+    low: ErrorMessage | int = 0
+    high: ErrorMessage | int = 10
+
+    @root_validator(skip_on_failure=True)
+    def check_range(cls, values: dict) -> dict:
+        if values["low"] > values["high"]:
+            raise ValueError("low is above high")
+        return values
+
+
+class RangeDataSource(MvpDataSource):
+    current_model = RangeModel()
+
+
+def test_partial_update_validates_only_changed_fields(form_data_source):
+    data_source, notifications = form_data_source
+    assert data_source.update_model_partial({"age": "42"})
+    assert data_source.current_model.age == 42
+    assert notifications == [{"age"}]
+
+
+def test_partial_update_substitutes_error_messages(form_data_source):
+    data_source, _ = form_data_source
+    assert not data_source.update_model_partial({"age": "old", "name": "Jane"})
+    model = data_source.current_model
+    assert isinstance(model.age, ErrorMessage)
+    assert model.name == "Jane"
+
+    assert not data_source.update_model_partial({"email": "jane"})
+    assert data_source.current_model.email.message == "not an email address"
+
+
+def test_complete_update_substitutes_error_messages(form_data_source):
+    data_source, notifications = form_data_source
+    assert not data_source.update_model_complete(
+        {"name": "Jane", "age": "old", "email": "jane@example.com"}
+    )
+    model = data_source.current_model
+    assert isinstance(model.age, ErrorMessage)
+    assert model.email == "jane@example.com"
+    assert notifications == [{"name", "age", "email"}]
+
+
+def test_unchanged_model_notifies_nobody(form_data_source):
+    data_source, notifications = form_data_source
+    data_source.update_model_partial({"age": 0})
+    data_source.update_model_complete(data_source.current_model.dict())
+    assert notifications == []
+
+
+def test_root_validators_validate_the_whole_model(get_data_source):
+    data_source, _ = get_data_source(RangeDataSource)
+    assert data_source.update_model_partial({"low": 5})
+    assert data_source.current_model.low == 5
+    with pytest.raises(ValidationError):
+        # errors of root validators can't be assigned to a field
+        data_source.update_model_partial({"low": 20})
+    assert data_source.current_model.low == 5
+
+
+class AliasModel(MvpModel):
+    first_name: ErrorMessage | str = Field("", alias="firstName")
+    age: ErrorMessage | int = Field(1, alias="userAge")
+
+
+class AliasDataSource(MvpDataSource):
+    current_model = AliasModel()
+
+
+def test_partial_update_keeps_other_aliased_fields(get_data_source):
+    data_source, _ = get_data_source(AliasDataSource)
+    assert data_source.update_model_partial({"userAge": 3})
+    assert data_source.update_model_partial({"firstName": "z"})
+    model = data_source.current_model
+    assert model.first_name == "z"
+    assert model.age == 3
+
+
+def test_invalid_aliased_fields_hold_error_messages(get_data_source):
+    data_source, _ = get_data_source(AliasDataSource)
+    assert not data_source.update_model_complete(
+        {"firstName": "y", "userAge": "notint"}
+    )
+    model = data_source.current_model
+    assert model.first_name == "y"
+    assert isinstance(model.age, ErrorMessage)
@@ -0,0 +1,268 @@
+import flet as ft
+import polars as pl
+import pytest
+
+from fletched.controls import ModelDataTable, ModelDataTableConfig, datatable
+
+
+def get_pages(table: ModelDataTable) -> list[int]:
+    ids = []
+    for page_index in range(table.page_count):
+        table.go_to_page(page_index)
+        ids += table._get_window()["id"].to_list()
+    return ids
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize("descending", [False, True])
+def test_sorted_pages_match_unpaged_order(lazy, descending):
+    model = pl.DataFrame({"id": [1, 2, 3, 4, 5], "price": [3, None, 1, None, 2]})
+    paged = ModelDataTable(
+        model=model.lazy() if lazy else model,
+        config=ModelDataTableConfig(page_size=2, sort=True),
+    )
+    unpaged = ModelDataTable(
+        model=model, config=ModelDataTableConfig(page_size=10, sort=True)
+    )
+    paged.sort("price", descending)
+    unpaged.sort("price", descending)
+
+    ids = get_pages(paged)
+    assert ids == unpaged._get_window()["id"].to_list()
+    assert ids[-2:] == [2, 4]
+
+
+def test_summary_without_columns_counts_found_rows():
+    model = pl.DataFrame({"id": [1, 2, 3], "name": ["alpha", "beta", "delta"]})
+    table = ModelDataTable(
+        model=model,
+        config=ModelDataTableConfig(
+            search=True, search_column_default_index=1, summary={"id": pl.count()}
+        ),
+    )
+    table._start_search("ta", debounce=None)
+    assert table._summary["id"].to_list() == [2]
+
+
+def test_summary_group_by_needs_a_summary():
+    with pytest.raises(ValueError):
+        ModelDataTableConfig(summary_group_by="name")
+
+
+def test_create_text_model_is_deprecated():
+    with pytest.deprecated_call():
+        ModelDataTableConfig(create_text_model=True)
+
+
+def get_search_table(model: pl.DataFrame, **config) -> ModelDataTable:
+    return ModelDataTable(
+        model=model,
+        config=ModelDataTableConfig(
+            search=True, search_column_default_index=1, **config
+        ),
+    )
+
+
+def get_names_model() -> pl.DataFrame:
+    names = ["alpha", "beta", "alps", "gamma", "delta", "alpine"]
+    return pl.DataFrame({"id": range(len(names)), "name": names})
+
+
+def get_found_ids(table: ModelDataTable) -> list[int]:
+    return table._get_window()["id"].to_list()
+
+
+def test_debounced_search_only_applies_the_latest_query():
+    table = get_search_table(get_names_model())
+    table._start_search("beta", debounce=0.05)
+    table._start_search("alp", debounce=0.05)
+    timer = table._search_timer
+    timer.join()  # type: ignore
+    assert table._search_result[1] == "alp"  # type: ignore
+    assert get_found_ids(table) == [0, 2, 5]
+
+
+def test_pending_search_is_applied_to_a_new_model():
+    table = get_search_table(get_names_model())
+    table._start_search("alp", debounce=0.05)
+    table.model = get_names_model().reverse()
+    table._search_timer.join()  # type: ignore
+    assert table._search_result[1] == "alp"  # type: ignore
+    assert get_found_ids(table) == [5, 2, 0]
+
+
+def test_applied_search_is_run_on_a_new_model():
+    table = get_search_table(get_names_model())
+    table._start_search("alp", debounce=None)
+    table.model = get_names_model().reverse()
+    assert table._search_result[1] == "alp"  # type: ignore
+    assert get_found_ids(table) == [5, 2, 0]
+
+
+def test_stale_search_result_is_discarded():
+    table = get_search_table(get_names_model())
+    generation = table._search_generation
+    table._start_search("beta", debounce=None)
+    table._run_search(generation, "alp", "name")
+    assert get_found_ids(table) == [1]
+
+
+def test_search_is_narrowed_to_previous_matches(monkeypatch):
+    table = get_search_table(get_names_model())
+    table._start_search("al", debounce=None)
+    searched = []
+    match = table._match
+
+    def spy(query, column, rows=None):
+        searched.append(None if rows is None else len(rows))
+        return match(query, column, rows)
+
+    monkeypatch.setattr(table, "_match", spy)
+    table._start_search("alp", debounce=None)
+    assert searched == [3]
+    assert get_found_ids(table) == [0, 2, 5]
+
+
+def test_sort_combined_with_search():
+    table = get_search_table(get_names_model(), sort=True)
+    table._start_search("alp", debounce=None)
+    table.sort("name", descending=True)
+    assert get_found_ids(table) == [2, 5, 0]
+    table._start_search("a", debounce=None)
+    assert table._get_window()["name"].to_list() == [
+        "gamma",
+        "delta",
+        "beta",
+        "alps",
+        "alpine",
+        "alpha",
+    ]
+    table.sort(None)
+    assert get_found_ids(table) == [0, 1, 2, 3, 4, 5]
+
+
+def test_append_with_max_rows_under_active_search():
+    table = get_search_table(get_names_model(), max_rows=6)
+    table._start_search("alp", debounce=None)
+    table.append(pl.DataFrame({"id": [6, 7], "name": ["alpaca", "omega"]}))
+    # the two oldest rows (alpha and beta) are dropped
+    assert table.model["id"].to_list() == [2, 3, 4, 5, 6, 7]
+    assert get_found_ids(table) == [2, 5, 6]
+    table._start_search("alpa", debounce=None)
+    assert get_found_ids(table) == [6]
+
+
+def test_append_after_whitespace_query():
+    table = get_search_table(get_names_model(), search_query_syntax=True)
+    table._start_search(" ", debounce=None)
+    table.append(pl.DataFrame({"id": [6], "name": ["omega"]}))
+    assert get_found_ids(table) == [0, 1, 2, 3, 4, 5, 6]
+
+
+def test_keyed_rows_are_reused_and_only_changed_cells_patched(monkeypatch):
+    assigned = []
+    text_value = ft.Text.value
+
+    class RecordingText(ft.Text):
+        @property
+        def value(self):
+            return text_value.fget(self)  # type: ignore
+
+        @value.setter
+        def value(self, value):
+            assigned.append(value)
+            text_value.fset(self, value)  # type: ignore
+
+    monkeypatch.setattr(ft, "Text", RecordingText)
+    table = get_search_table(get_names_model(), row_key="id")
+    rows = list(table.data_table.rows)  # type: ignore
+
+    assigned.clear()
+    table.model = get_names_model().with_columns(
+        pl.when(pl.col("id") == 2)
+        .then(pl.lit("alpes"))
+        .otherwise(pl.col("name"))
+        .alias("name")
+    )
+    assert table.data_table.rows == rows
+    assert table._rows_built == 0
+    assert assigned == ["alpes"]
+
+    table._start_search("alp", debounce=None)
+    assert table.data_table.rows == [rows[0], rows[2], rows[5]]
+    assert table._rows_built == 0
+    assert assigned == ["alpes"]
+
+
+def test_page_count_includes_a_partial_last_page():
+    table = get_search_table(get_names_model(), page_size=4)
+    assert table.page_count == 2
+    table.go_to_page(1)
+    assert get_found_ids(table) == [4, 5]
+    assert table.pagination_text.value == "5-6 of 6"
+
+
+def test_go_to_page_is_clamped_at_both_ends():
+    table = get_search_table(get_names_model(), page_size=4)
+    table.go_to_page(5)
+    assert table.page_index == 1
+    assert table.next_page_button.disabled
+    table.go_to_page(-1)
+    assert table.page_index == 0
+    assert table.previous_page_button.disabled
+    assert get_found_ids(table) == [0, 1, 2, 3]
+
+
+def test_pagination_text_follows_a_filtered_model():
+    table = get_search_table(get_names_model(), page_size=4)
+    table.go_to_page(1)
+    table._start_search("alp", debounce=None)
+    assert table.page_index == 0
+    assert table.page_count == 1
+    assert table.pagination_text.value == "1-3 of 3"
+    table._start_search("omega", debounce=None)
+    assert table.pagination_text.value == "0-0 of 0"
+
+
+def test_lazy_model_without_page_size_is_paginated(monkeypatch):
+    monkeypatch.setattr(datatable, "LAZY_PAGE_SIZE", 2)
+    model = pl.DataFrame({"id": [1, 2, 3, 4, 5]})
+    config = ModelDataTableConfig()
+    table = ModelDataTable(model=model.lazy(), config=config)
+
+    assert table._get_window()["id"].to_list() == [1, 2]
+    assert table.page_count == 3
+    assert config.page_size is None
+    with pytest.raises(ValueError):
+        ModelDataTable(model=model, config=config).model = model.lazy()
+
+
+@pytest.mark.parametrize("column", ["price", "name", "weight"])
+@pytest.mark.parametrize("descending", [False, True])
+def test_toggled_sort_matches_fresh_sort(column, descending):
+    model = pl.DataFrame(
+        {
+            "id": range(8),
+            "price": [3, None, 1, 3, None, 1, 2, 3],
+            "name": ["b", "a", None, "b", "a", "c", None, "a"],
+            "weight": [0.5, 0.0, -0.0, None, 0.5, 1.5, 0.0, 0.5],
+        }
+    )
+    config = ModelDataTableConfig(sort=True, page_size=10)
+    toggled = ModelDataTable(model=model, config=config)
+    toggled.sort(column, not descending)
+    toggled.sort(column, descending)
+    fresh = ModelDataTable(model=model, config=config)
+    fresh.sort(column, descending)
+
+    assert toggled._get_sort_permutation()[0].to_list() == (
+        fresh._get_sort_permutation()[0].to_list()
+    )
+    assert toggled._get_window()["id"].to_list() == fresh._get_window()["id"].to_list()
+
+
+def test_sort_needs_one_direction_per_column():
+    table = get_search_table(get_names_model(), sort=True)
+    with pytest.raises(ValueError):
+        table.sort(["id", "name"], descending=[True])
+    assert table._sort_by == []
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from fletched.controls import ModelDataTable, ModelDataTableConfig, Range, export
+from fletched.controls.export import export_view, get_export_format
+
+MODEL = pl.DataFrame(
+    {"id": [1, 2, 3, 4, 5], "name": ["e", "d", "c", "b", "a"], "price": [5, 1, 4, 2, 3]}
+)
+READERS = {"csv": pl.read_csv, "ndjson": pl.read_ndjson, "parquet": pl.read_parquet}
+
+
+def read(path: Path) -> pl.DataFrame:
+    return READERS[get_export_format(path)](path)
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_CHUNK_SIZE", 2)
+
+
+@pytest.mark.parametrize("file_format", ["csv", "ndjson", "parquet"])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_export_writes_all_rows(tmp_path: Path, file_format, lazy):
+    path = tmp_path / f"export.{file_format}"
+    view = MODEL.lazy() if lazy else MODEL
+    export_view(view, None, path, file_format)
+    assert READERS[file_format](path).frame_equal(MODEL)
+
+
+@pytest.mark.parametrize("file_format", ["csv", "ndjson", "parquet"])
+def test_export_writes_selected_rows_in_order(tmp_path: Path, file_format):
+    path = tmp_path / f"export.{file_format}"
+    rows = pl.Series([4, 0, 2], dtype=pl.UInt32)
+    export_view(MODEL, rows, path, file_format)
+    assert READERS[file_format](path).frame_equal(MODEL[rows])
+
+
+def test_export_sinks_lazy_parquet(tmp_path: Path, monkeypatch):
+    path = tmp_path / "export.parquet"
+    monkeypatch.setattr(
+        pl.LazyFrame, "collect", lambda *args, **kwargs: pytest.fail("collected")
+    )
+    export_view(MODEL.lazy(), None, path, "parquet", sink=True)
+    assert pl.read_parquet(path).frame_equal(MODEL)
+
+
+def test_export_falls_back_if_lazy_parquet_cant_be_sunk(tmp_path: Path, monkeypatch):
+    def sink_parquet(*args, **kwargs):
+        raise pl.InvalidOperationError("not supported by the streaming engine")
+
+    path = tmp_path / "export.parquet"
+    monkeypatch.setattr(pl.LazyFrame, "sink_parquet", sink_parquet)
+    progress = []
+    export_view(MODEL.lazy(), None, path, "parquet", progress.append, sink=True)
+    assert pl.read_parquet(path).frame_equal(MODEL)
+    assert progress == [1.0]
+
+
+def test_export_of_empty_view_keeps_header(tmp_path: Path):
+    path = tmp_path / "export.csv"
+    progress = []
+    export_view(MODEL.clear(), None, path, "csv", progress.append)
+    assert path.read_text().strip() == "id,name,price"
+    assert progress == [1.0]
+
+    path = tmp_path / "export.parquet"
+    export_view(MODEL.lazy().clear(), None, path, "parquet")
+    assert pl.read_parquet(path).schema == MODEL.schema
+
+
+@pytest.mark.parametrize("file_format", ["csv", "ndjson"])
+def test_export_reports_progress_per_chunk(tmp_path: Path, file_format):
+    progress = []
+    export_view(MODEL, None, tmp_path / "export", file_format, progress.append)
+    assert progress == [0.4, 0.8, 1.0]
+
+
+def test_export_rejects_unknown_format(tmp_path: Path):
+    with pytest.raises(ValueError):
+        export_view(MODEL, None, tmp_path / "export.xlsx", "xlsx")
+    with pytest.raises(ValueError):
+        ModelDataTable(model=MODEL).export(tmp_path / "export.xlsx")
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl", ".parquet"])
+def test_table_exports_sorted_and_filtered_view(tmp_path: Path, lazy, suffix):
+    table = ModelDataTable(
+        model=MODEL.lazy() if lazy else MODEL,
+        config=ModelDataTableConfig(search=True, search_column_default_index=1),
+    )
+    table.filter([Range("price", min=2)])
+    table.sort("price", descending=True)
+    progress = []
+    future = table.export(tmp_path / f"export{suffix}", on_progress=progress.append)
+    assert read(future.result())["id"].to_list() == [1, 3, 5, 4]
+    assert progress[-1] == 1.0
+
+    table._start_search("a", debounce=None)
+    future = table.export(tmp_path / f"search{suffix}")
+    assert read(future.result())["id"].to_list() == [5]
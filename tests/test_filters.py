@@ -0,0 +1,84 @@
+from datetime import date
+
+import polars as pl
+import pytest
+
+from fletched.controls import IsNull, Matches, OneOf, Range
+from fletched.controls.filters import get_filter_expression, parse_query
+
+SCHEMA = {
+    "price": pl.Float64,
+    "count": pl.Int64,
+    "status": pl.Utf8,
+    "created": pl.Date,
+    "active": pl.Boolean,
+}
+
+
+@pytest.mark.parametrize(
+    "query, predicate",
+    [
+        ("price>10", Range("price", min=10.0, include_min=False)),
+        ("price>=10", Range("price", min=10.0)),
+        ("count<5", Range("count", max=5, include_max=False)),
+        ("count<=5", Range("count", max=5)),
+        ("count:1..5", Range("count", min=1, max=5)),
+        ("count:..5", Range("count", max=5)),
+        (
+            "created:2023-01-01..",
+            Range("created", min=date(2023, 1, 1)),
+        ),
+        ("status:open,pending", OneOf("status", ("open", "pending"))),
+        ("status=open", OneOf("status", ("open",))),
+        ('status:"on hold"', OneOf("status", ("on hold",))),
+        ("active=true", OneOf("active", (True,))),
+        ("status~^op", Matches("status", "^op")),
+        ("status:null", IsNull("status")),
+        ("status:!null", IsNull("status", null=False)),
+    ],
+)
+def test_predicates(query, predicate):
+    assert parse_query(query, SCHEMA) == ([predicate], "")
+
+
+def test_text_is_kept_around_predicates():
+    predicates, text = parse_query("jane price>10 doe", SCHEMA)
+    assert predicates == [Range("price", min=10.0, include_min=False)]
+    assert text == "jane doe"
+
+
+@pytest.mark.parametrize("query", ["a  b", "a\tb", "price>10 a  b"])
+def test_text_whitespace_is_kept(query):
+    assert parse_query(query, SCHEMA)[1] == query.removeprefix("price>10 ")
+
+
+@pytest.mark.parametrize(
+    "query", ["unknown>10", "count>many", "12:30", "status~(", "status~(?<=a)l"]
+)
+def test_unknown_columns_and_invalid_values_are_text(query):
+    assert parse_query(query, SCHEMA) == ([], query)
+
+
+def test_regex_ignores_case_unless_case_sensitive():
+    assert parse_query("status~open", SCHEMA, case_sensitive=False) == (
+        [Matches("status", "(?i)open")],
+        "",
+    )
+
+
+def test_text_values_ignore_case_unless_case_sensitive():
+    model = pl.DataFrame({"status": ["Open", "open", "closed", None]})
+    predicates, _ = parse_query("status:OPEN", SCHEMA, case_sensitive=False)
+    assert predicates == [OneOf("status", ("OPEN",), case_sensitive=False)]
+    found = model.filter(get_filter_expression(predicates))  # type: ignore
+    assert found["status"].to_list() == ["Open", "open"]
+    predicates, _ = parse_query("count=1", SCHEMA, case_sensitive=False)
+    assert predicates == [OneOf("count", (1,))]
+
+
+def test_predicates_are_combined():
+    model = pl.DataFrame({"count": [1, 5, None, 8], "status": ["a", "b", "a", None]})
+    predicates, _ = parse_query("count:1..6 status:a,b", SCHEMA)
+    expression = get_filter_expression(predicates)
+    assert model.filter(expression)["count"].to_list() == [1, 5]  # type: ignore
+    assert get_filter_expression([]) is None
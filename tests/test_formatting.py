@@ -0,0 +1,74 @@
+from datetime import date
+
+import polars as pl
+import pytest
+
+from fletched.controls import ColumnFormat
+
+
+def format_values(column_format: ColumnFormat, values: list, **series) -> list:
+    return column_format.format(pl.Series("x", values, **series)).to_list()
+
+
+def test_floats_with_precision_and_separators():
+    column_format = ColumnFormat(precision=2, thousands_separator=",")
+    assert format_values(column_format, [1234567.891, -1234.5, 0.0]) == [
+        "1,234,567.89",
+        "-1,234.50",
+        "0.00",
+    ]
+
+
+def test_negative_numbers_rounded_to_zero_have_no_sign():
+    assert format_values(ColumnFormat(precision=2), [-0.004]) == ["0.00"]
+
+
+def test_integers_with_separators():
+    column_format = ColumnFormat(thousands_separator=".", decimal_separator=",")
+    assert format_values(column_format, [-1234567, 0, 999, -1000]) == [
+        "-1.234.567",
+        "0",
+        "999",
+        "-1.000",
+    ]
+
+
+def test_nan_inf_and_nulls():
+    column_format = ColumnFormat(precision=1, null_value="-")
+    assert format_values(column_format, [float("nan"), float("inf"), None]) == [
+        "NaN",
+        "inf",
+        "-",
+    ]
+
+
+@pytest.mark.parametrize("dtype", [pl.UInt8, pl.UInt32, pl.UInt64])
+def test_unsigned_integers(dtype):
+    column_format = ColumnFormat(precision=1, thousands_separator=",")
+    assert format_values(column_format, [0, 1234, None], dtype=dtype) == [
+        "0.0",
+        "1,234.0",
+        "",
+    ]
+
+
+def test_dates():
+    values = [date(2023, 3, 1), None]
+    assert format_values(ColumnFormat(date_format="%d.%m.%Y"), values) == [
+        "01.03.2023",
+        "",
+    ]
+    assert format_values(ColumnFormat(null_value="-"), values) == ["2023-03-01", "-"]
+
+
+@pytest.mark.parametrize("dtype", [pl.Float64, pl.Int64, pl.Utf8])
+def test_empty_input(dtype):
+    column_format = ColumnFormat(precision=1, thousands_separator=",", max_length=3)
+    assert format_values(column_format, [], dtype=dtype) == []
+
+
+def test_truncation():
+    assert format_values(ColumnFormat(max_length=5), ["abcdefgh", "abcde"]) == [
+        "abcd…",
+        "abcde",
+    ]
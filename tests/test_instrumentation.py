@@ -0,0 +1,138 @@
+import flet as ft
+import polars as pl
+import pytest
+
+from fletched import instrumentation
+from fletched.controls import ModelDataTable
+from fletched.instrumentation import COUNT, TIMING, Histogram, MetricsRegistry
+from fletched.routed_app import RoutedApp, ViewBuilder, route
+
+
+@route("/items/:id")
+class ItemViewBuilder(ViewBuilder):
+    def build_view(self, route_params: dict[str, str]) -> ft.View:
+        return ft.View(route=self.route)
+
+
+@pytest.fixture
+def metrics():
+    registry = MetricsRegistry()
+    events = []
+
+    def record(*event) -> None:
+        events.append(event)
+
+    instrumentation.add_hook(registry)
+    instrumentation.add_hook(record)
+    yield registry, events
+    instrumentation.remove_hook(registry)
+    instrumentation.remove_hook(record)
+    instrumentation.enabled = True
+
+
+def test_navigation_records_stages(page, metrics):
+    registry, _ = metrics
+    app = RoutedApp(page)
+    app.add_view_builders([ItemViewBuilder])
+    page.go("/items/1")
+    page.go("/items/2")
+    page.go("/missing")
+
+    assert registry.histogram("route_match", route="/items/:id").count == 2
+    assert registry.histogram("route_match").count == 1
+    build_view = registry.histogram("build_view", route="/items/:id", view="View")
+    assert build_view.count == 2
+    assert registry.histogram("page_update", route="/items/:id").count == 2
+    assert registry.histogram("page_update", route="None").count == 1
+
+
+def test_table_render_is_tagged_with_its_view(page, metrics, monkeypatch):
+    registry, _ = metrics
+    table = ModelDataTable(model=pl.DataFrame({"id": [1, 2, 3]}))
+    monkeypatch.setattr(table, "update", lambda: None)
+    table.page = page
+    page.views.append(ft.View(route="/items/:id"))
+    table.go_to_page(0)
+
+    tags = {"control": "ModelDataTable", "route": "/items/:id", "view": "View"}
+    assert registry.histogram("table_render", **tags).count == 1
+    assert registry.counter("rows_rendered", **tags) == 3
+
+
+def test_timed_and_count_reach_every_hook(metrics):
+    registry, events = metrics
+    with instrumentation.timed("stage", route="/a") as tags:
+        tags["view"] = "AView"
+    instrumentation.count("things", 3, route="/a")
+    instrumentation.count("things", route="/a")
+
+    assert [event[:2] for event in events] == [
+        (TIMING, "stage"),
+        (COUNT, "things"),
+        (COUNT, "things"),
+    ]
+    assert events[0][3] == {"route": "/a", "view": "AView"}
+    assert registry.histogram("stage", route="/a", view="AView").count == 1
+    assert registry.counter("things", route="/a") == 4
+    assert registry.counter("things") == 0
+
+
+def test_disabled_instrumentation_records_nothing(metrics):
+    _, events = metrics
+    instrumentation.enabled = False
+    with instrumentation.timed("stage"):
+        pass
+    instrumentation.count("things")
+    assert events == []
+
+
+def test_removed_hook_is_not_called(metrics):
+    calls = []
+
+    def hook(*event) -> None:
+        calls.append(event)
+
+    instrumentation.add_hook(hook)
+    instrumentation.count("things")
+    instrumentation.remove_hook(hook)
+    instrumentation.count("things")
+    assert len(calls) == 1
+    assert hook not in instrumentation.hooks
+
+
+def test_histogram_quantile_is_the_upper_bucket_bound():
+    histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+    assert histogram.quantile(0.5) == 0.0
+    for value in [0.005, 0.005, 0.05, 0.5, 3.0]:
+        histogram.observe(value)
+
+    assert histogram.quantile(0.4) == 0.01
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.8) == 1.0
+    # above the largest bound, the maximum is all that is known
+    assert histogram.quantile(1.0) == 3.0
+    assert histogram.count == 5
+    assert histogram.min == 0.005
+    assert histogram.mean == pytest.approx(3.56 / 5)
+
+
+def test_registry_snapshot_and_reset():
+    registry = MetricsRegistry(buckets=(0.1,))
+    registry(TIMING, "stage", 0.05, {"route": "/a"})
+    registry(COUNT, "things", 2, {})
+    snapshot = registry.snapshot()
+    assert snapshot["timings"] == [
+        {
+            "name": "stage",
+            "tags": {"route": "/a"},
+            "count": 1,
+            "mean": 0.05,
+            "p50": 0.05,
+            "p95": 0.05,
+            "max": 0.05,
+        }
+    ]
+    assert snapshot["counts"] == [{"name": "things", "tags": {}, "value": 2}]
+
+    registry.reset()
+    assert registry.snapshot() == {"timings": [], "counts": []}
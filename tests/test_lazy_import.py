@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["flet", "polars"]
+
+
+def get_imported(statement: str) -> list[str]:
+    # a fresh interpreter, the test session has long imported everything
+    loaded = f"[module for module in {HEAVY_MODULES} if module in sys.modules]"
+    check = f"import sys; {statement}; print(*{loaded})"
+    result = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import fletched",
+        "import fletched.mvp",
+        "import fletched.routed_app",
+        "import fletched.controls",
+        "from fletched.mvp import MvpDataSource, MvpModel",
+    ],
+)
+def test_import_leaves_flet_and_polars_unloaded(statement):
+    assert get_imported(statement) == []
+
+
+def test_attribute_access_imports_the_module():
+    assert get_imported("import fletched.mvp; fletched.mvp.MvpView") == ["flet"]
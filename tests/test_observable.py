@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+from fletched.mvp import MvpPresenter
+from fletched.mvp.observable import Observable
+
+
+def test_observers_get_the_changed_fields_if_they_accept_them():
+    observable = Observable()
+    calls = []
+    observable.register(lambda changed_fields: calls.append(changed_fields))
+    observable.register(lambda: calls.append("no arguments"))
+    observable.notify_observers({"name"})
+    assert calls == [{"name"}, "no arguments"]
+
+
+@dataclass
+class CounterPresenter(MvpPresenter):
+    def update_view(self) -> None:  # type: ignore
+        self.updates = getattr(self, "updates", 0) + 1
+
+
+def test_presenter_update_view_without_changed_fields(get_data_source):
+    data_source, _ = get_data_source()
+    presenter = CounterPresenter(data_source=data_source, view=None)  # type: ignore
+    data_source.update_model_partial({"count": 1})
+    assert presenter.updates == 1
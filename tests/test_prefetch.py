@@ -0,0 +1,60 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fletched.routed_app import RoutedApp
+
+
+def test_prefetched_data_source_is_used(get_view_builder):
+    view_builder = get_view_builder()
+    prefetched = view_builder.prefetch({"id": "1"}).result()  # type: ignore
+    assert view_builder._get_data_source({"id": "1"}) is prefetched
+
+
+def test_expired_prefetch_is_not_used(get_view_builder):
+    view_builder = get_view_builder(prefetch_ttl=0)
+    prefetched = view_builder.prefetch({"id": "1"}).result()  # type: ignore
+    assert view_builder._get_data_source({"id": "1"}) is not prefetched
+
+
+def test_failed_prefetch_is_logged(get_view_builder, caplog, monkeypatch):
+    view_builder = get_view_builder()
+    monkeypatch.setattr(view_builder.data_source_class, "fail", True)
+    view_builder.prefetch({"id": "1"}).exception()  # type: ignore
+    monkeypatch.setattr(view_builder.data_source_class, "fail", False)
+    with caplog.at_level(logging.ERROR):
+        data_source = view_builder._get_data_source({"id": "1"})
+    assert data_source.current_model.name == "1"
+    assert "database is down" in caplog.text
+
+
+def test_concurrent_prefetches_stay_within_cache_size(get_view_builder):
+    view_builder = get_view_builder(prefetch_cache_size=4)
+    route_params = [{"id": str(item_id % 16)} for item_id in range(400)]
+    # like hover handlers, which flet runs on its thread pool
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = list(executor.map(view_builder.prefetch, route_params))
+    assert all(future is not None for future in futures)
+    assert len(view_builder._prefetched) == 4
+    data_source = view_builder._get_data_source(route_params[-1])
+    assert data_source.current_model.name == "15"
+
+
+def test_concurrent_prefetches_create_a_single_view_builder(
+    page, item_view_builder_class
+):
+    instances = []
+
+    class CountedViewBuilder(item_view_builder_class):
+        def __init__(self, **kwargs) -> None:
+            # widens the gap between looking a ViewBuilder up and storing it
+            time.sleep(0.01)
+            super().__init__(**kwargs)
+            instances.append(self)
+
+    app = RoutedApp(page)
+    app.add_view_builders([CountedViewBuilder])
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = list(executor.map(app.prefetch, ["/item/1"] * 8))
+    assert all(future is not None for future in futures)
+    assert len(instances) == 1
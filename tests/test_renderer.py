@@ -0,0 +1,57 @@
+import flet as ft
+import pytest
+
+from fletched.mvp import ErrorMessage
+from fletched.mvp.renderer import MvpRenderer
+
+
+@pytest.fixture
+def renderer() -> MvpRenderer:
+    name: ft.Ref[ft.TextField] = ft.Ref()
+    action: ft.Ref[ft.TextButton] = ft.Ref()
+    name.current = ft.TextField()
+    action.current = ft.TextButton()
+    return MvpRenderer({"name": name, "action": action})
+
+
+def test_fields_are_rendered_to_value_or_text(renderer, form_model):
+    model = form_model.copy(update={"name": "Jane", "action": "Save"})
+    assert renderer.render(model) == 2
+    assert renderer.ref_map["name"].current.value == "Jane"
+    assert renderer.ref_map["action"].current.text == "Save"
+
+
+def test_only_changed_fields_are_rendered(renderer, form_model):
+    renderer.render(form_model.copy(update={"name": "Jane", "action": "Save"}))
+    model = form_model.copy(update={"name": "John", "action": "Send"})
+    assert renderer.render(model, changed_fields={"name"}) == 1
+    assert renderer.ref_map["name"].current.value == "John"
+    assert renderer.ref_map["action"].current.text == "Save"
+    assert renderer.render(model, changed_fields=set()) == 0
+
+
+def test_error_text_is_cleared_once_the_field_is_valid(renderer, form_model):
+    error = ErrorMessage(message="too short")
+    renderer.render(form_model.copy(update={"name": error}))
+    name = renderer.ref_map["name"].current
+    assert name.error_text == "too short"
+
+    renderer.render(form_model.copy(update={"name": "Jane"}), changed_fields={"name"})
+    assert name.error_text is None
+    assert name.value == "Jane"
+
+
+def test_error_text_of_user_code_is_kept(renderer, form_model):
+    name = renderer.ref_map["name"].current
+    name.error_text = "already taken"
+    renderer.render(form_model.copy(update={"name": "Jane"}))
+    assert name.error_text == "already taken"
+
+
+def test_invalidated_bindings_follow_rebuilt_controls(renderer, form_model):
+    renderer.render(form_model.copy(update={"name": "Jane"}))
+    rebuilt = ft.TextField()
+    renderer.ref_map["name"].current = rebuilt
+    renderer.invalidate()
+    renderer.render(form_model.copy(update={"name": "John"}))
+    assert rebuilt.value == "John"
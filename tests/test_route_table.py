@@ -0,0 +1,88 @@
+import flet as ft
+import pytest
+
+from fletched.routed_app import RoutedApp, ViewBuilder
+from fletched.routed_app.route_table import RouteTable
+
+
+def make_view_builder(route: str) -> type[ViewBuilder]:
+    def build_view(self, route_params: dict[str, str]) -> ft.View:
+        return ft.View(route=self.route)
+
+    return type(
+        "ViewBuilder", (ViewBuilder,), {"route": route, "build_view": build_view}
+    )
+
+
+@pytest.mark.parametrize("route", ["/items", "/items/:id"])
+def test_route_declared_twice_is_served_by_the_last_view_builder(page, route):
+    first = make_view_builder(route)
+    last = make_view_builder(route)
+    app = RoutedApp(page)
+    app.add_view_builders([first, last])
+    path = route.replace(":id", "1")
+
+    view_builder_class, _ = app.route_table.match(path)  # type: ignore
+    assert view_builder_class is last
+    assert list(app.route_table.patterns.values()) == [last]
+    with pytest.deprecated_call():
+        view_builders = app.route_pattern_to_viewbuilder
+    assert [type(view_builder) for view_builder in view_builders.values()] == [last]
+
+
+def get_route_table(*routes: str, cache_size: int = 256) -> RouteTable:
+    route_table = RouteTable(cache_size=cache_size)
+    for route in routes:
+        route_table.add(route, make_view_builder(route))
+    return route_table
+
+
+def match_route(route_table: RouteTable, path: str) -> str | None:
+    match = route_table.match(path)
+    return match[0].route if match else None
+
+
+def test_most_specific_route_wins():
+    route_table = get_route_table("/:section/:id", "/users/:id", "/users/me")
+    assert match_route(route_table, "/users/me") == "/users/me"
+    assert match_route(route_table, "/users/1") == "/users/:id"
+    assert match_route(route_table, "/items/1") == "/:section/:id"
+
+
+def test_catch_all_route_ranks_last():
+    route_table = get_route_table("/files/:path*", "/files/:a/:b")
+    assert match_route(route_table, "/files/x/y") == "/files/:a/:b"
+    assert match_route(route_table, "/files/x") == "/files/:path*"
+    assert match_route(route_table, "/files/x/y/z") == "/files/:path*"
+
+
+def test_static_and_dynamic_routes():
+    route_table = get_route_table("/", "/items", "/items/:id")
+    assert route_table.match("/") == (route_table._static_routes["/"], {})
+    assert match_route(route_table, "/items") == "/items"
+    match = route_table.match("/items/42")
+    assert match and match[1] == {"id": "42"}
+    assert route_table.match("/items/42/edit") is None
+    assert route_table.match("/unknown") is None
+
+
+@pytest.mark.parametrize("path", ["/items", "/items/"])
+def test_trailing_slashes(path):
+    route_table = get_route_table("/items", "/items/:id")
+    assert match_route(route_table, path) == "/items"
+    assert match_route(route_table, "/items/1/") == "/items/:id"
+
+
+def test_match_cache():
+    route_table = get_route_table("/items/:id", cache_size=2)
+    first = route_table.match("/items/1")
+    # callers get their own route_params
+    first[1]["id"] = "changed"  # type: ignore
+    assert route_table.match("/items/1")[1] == {"id": "1"}  # type: ignore
+    route_table.match("/items/2")
+    route_table.match("/items/3")
+    assert list(route_table._cache) == ["/items/2", "/items/3"]
+    # adding a route invalidates cached matches, including misses
+    assert route_table.match("/other") is None
+    route_table.add("/other", make_view_builder("/other"))
+    assert match_route(route_table, "/other") == "/other"
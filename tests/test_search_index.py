@@ -0,0 +1,94 @@
+import polars as pl
+import pytest
+
+from fletched.controls import ModelDataTable, ModelDataTableConfig
+from fletched.controls.datatable import ALL_COLUMNS
+from fletched.controls.search_index import TrigramIndex
+
+TEXTS = [
+    "alpha",
+    "Alpha Beta",
+    "aaaa",
+    "aaa",
+    "abababa",
+    None,
+    "",
+    "beta alpha",
+    "xyz",
+    "ALPHA",
+    "éclair é",
+]
+QUERIES = [
+    "a",
+    "al",
+    "alp",
+    "alpha",
+    "ALPH",
+    "aaaa",
+    "aaaaa",
+    "abab",
+    "baba",
+    "a b",
+    "pha b",
+    "éclair",
+    "missing",
+]
+
+
+def find(texts: pl.Series, query: str) -> list[int]:
+    return texts.str.contains(query, literal=True).arg_true().to_list()
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_index_matches_contains(query):
+    texts = pl.Series("text", TEXTS)
+    rows = TrigramIndex(texts).search(query)
+    if len(query) < 3:
+        # too short for trigrams, the column is scanned instead
+        assert rows is None
+    else:
+        assert rows is not None and rows.to_list() == find(texts, query)
+
+
+def test_index_of_empty_texts():
+    texts = pl.Series("text", ["", "ab", None], dtype=pl.Utf8)
+    assert TrigramIndex(texts).search("abc").to_list() == []  # type: ignore
+
+
+def get_table(search_index: bool, **config) -> ModelDataTable:
+    model = pl.DataFrame({"id": range(len(TEXTS)), "name": TEXTS, "other": TEXTS[::-1]})
+    table = ModelDataTable(
+        model=model,
+        config=ModelDataTableConfig(
+            **{
+                "search": True,
+                "search_column_default_index": 1,
+                "search_index": search_index,
+                **config,
+            }
+        ),
+    )
+    if table.config.search_all_columns:
+        table.column_dropdown.value = ALL_COLUMNS
+    return table
+
+
+def get_found_ids(table: ModelDataTable, query: str) -> list[int]:
+    table._start_search(query, debounce=None)
+    return table._get_window()["id"].to_list()
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {},
+        {"search_case_sensitive": False},
+        {"search_all_columns": True},
+        {"search_all_columns": True, "search_case_sensitive": False},
+    ],
+)
+def test_table_search_with_index_matches_search_without(config):
+    indexed = get_table(True, **config)
+    scanned = get_table(False, **config)
+    for query in QUERIES:
+        assert get_found_ids(indexed, query) == get_found_ids(scanned, query), query
@@ -0,0 +1,49 @@
+import gc
+import weakref
+
+import pytest
+
+from fletched.routed_app import RoutedApp
+
+
+@pytest.fixture
+def app(page, item_view_builder_class) -> RoutedApp:
+    app = RoutedApp(page, view_cache_size=4)
+    app.add_view_builders([item_view_builder_class])
+    return app
+
+
+def test_cached_view_renders_its_own_controls(page, app):
+    page.go("/item/1")
+    first_view = page.views[0]
+    first_data_source = app.current_view_builder.data_source
+    page.go("/item/2")
+    second_view = page.views[0]
+    page.go("/item/1")
+
+    assert page.views[0] is first_view
+    assert first_view.ref_map["age"].current is first_view.controls[0]
+    first_data_source.update_model_partial({"age": 42})
+    assert first_view.controls[0].value == 42
+    assert second_view.controls[0].value == 5
+
+
+def test_auth_func_runs_once_per_navigation(page, app, auth_calls):
+    page.go("/item/1")
+    page.go("/item/2")
+    page.go("/item/1")
+    assert len(auth_calls) == 3
+
+
+@pytest.mark.parametrize("view_cache_size", [0, 2])
+def test_views_are_freed_after_navigating_away(
+    page, item_view_builder_class, view_cache_size
+):
+    app = RoutedApp(page, view_cache_size=view_cache_size)
+    app.add_view_builders([item_view_builder_class])
+    page.go("/item/0")
+    first_view = weakref.ref(page.views[0])
+    for item_id in range(1, 10):
+        page.go(f"/item/{item_id}")
+    gc.collect()
+    assert first_view() is None